@@ -5,7 +5,8 @@ This service handles field mappings from SSOT to platform-specific formats.
 It provides methods to retrieve, apply, and manage field mappings.
 """
 import logging
-from typing import Dict, Any, List, Optional, Union
+from contextlib import closing
+from typing import Callable, Dict, Any, List, Optional, Union
 from sqlalchemy.orm import Session
 
 from app.database.session import get_db
@@ -14,6 +15,9 @@ from app.core.exceptions import TransformationError
 
 logger = logging.getLogger(__name__)
 
+# Field mappings keyed by (job_type_id, source_platform, target_entity); cleared on writes
+_field_mappings_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+
 
 class FieldMappingService:
     """Service for handling field mappings between SSOT and platform-specific formats."""
@@ -60,6 +64,37 @@ class FieldMappingService:
             logger.error(f"Error retrieving field mappings: {str(e)}")
             return []
     
+    @staticmethod
+    def get_cached_field_mappings(job_type_id: int, source_platform: str, target_entity: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve field mappings, reusing the result of earlier lookups.
+        
+        Only non-empty results are cached, so a failed or empty lookup is retried
+        on the next call. The cache is cleared whenever a mapping is written.
+        
+        Args:
+            job_type_id: ID of the job type
+            source_platform: Source platform (e.g., 'ssot')
+            target_entity: Target entity (e.g., 'user', 'site', 'call_queue')
+            
+        Returns:
+            List of field mapping dictionaries (shared; do not modify)
+        """
+        key = (job_type_id, source_platform, target_entity)
+        mappings = _field_mappings_cache.get(key)
+        if mappings is None:
+            # Use a short-lived session and release it as soon as the query returns
+            with closing(next(get_db())) as db:
+                mappings = FieldMappingService.get_field_mappings(job_type_id, source_platform, target_entity, db=db)
+            if mappings:
+                _field_mappings_cache[key] = mappings
+        return mappings
+    
+    @staticmethod
+    def clear_field_mappings_cache() -> None:
+        """Drop all cached field mappings."""
+        _field_mappings_cache.clear()
+    
     @staticmethod
     def apply_field_mappings(data: Dict[str, Any], mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -90,23 +125,7 @@ class FieldMappingService:
                 
                 # Apply transformation rule if specified
                 if transformation_rule and value is not None:
-                    try:
-                        # Simple transformation rules
-                        if transformation_rule == "uppercase":
-                            value = str(value).upper()
-                        elif transformation_rule == "lowercase":
-                            value = str(value).lower()
-                        elif transformation_rule == "capitalize":
-                            value = str(value).capitalize()
-                        elif transformation_rule == "boolean":
-                            value = bool(value)
-                        elif transformation_rule == "integer":
-                            value = int(value) if value else 0
-                        elif transformation_rule == "string":
-                            value = str(value) if value is not None else ""
-                        # More complex rules can be added here
-                    except Exception as e:
-                        logger.warning(f"Error applying transformation rule '{transformation_rule}' to field '{ssot_field}': {str(e)}")
+                    value = FieldMappingService._apply_transformation_rule(value, transformation_rule, ssot_field)
                 
                 # Add the field to the transformed data with the target field name
                 transformed_data[target_field] = value
@@ -119,6 +138,95 @@ class FieldMappingService:
         
         return transformed_data
     
+    @staticmethod
+    def compile_field_mappings(mappings: List[Dict[str, Any]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Compile field mappings into a function specialized for those mappings.
+        
+        The returned function behaves like apply_field_mappings with the same
+        mappings, but the mapping list is unrolled into straight-line assignments
+        once, so applying it to a record no longer iterates over the mappings.
+        
+        Args:
+            mappings: List of field mapping dictionaries
+            
+        Returns:
+            Function taking source data (SSOT format) and returning transformed data
+        """
+        if not mappings:
+            return lambda data: data
+        
+        lines = [
+            "def _apply_mappings(data):",
+            "    if not data:",
+            "        return data",
+            "    transformed_data = {}",
+            "    missing_required_fields = []",
+        ]
+        
+        for mapping in mappings:
+            ssot_field = repr(mapping["ssot_field"])
+            target_field = repr(mapping["target_field"])
+            transformation_rule = mapping.get("transformation_rule")
+            
+            lines.append(f"    if {ssot_field} in data:")
+            if transformation_rule:
+                lines.append(f"        value = data[{ssot_field}]")
+                lines.append("        if value is not None:")
+                lines.append(f"            value = _apply_rule(value, {transformation_rule!r}, {ssot_field})")
+                lines.append(f"        transformed_data[{target_field}] = value")
+            else:
+                lines.append(f"        transformed_data[{target_field}] = data[{ssot_field}]")
+            
+            if mapping.get("is_required", False):
+                lines.append("    else:")
+                lines.append(f"        missing_required_fields.append({ssot_field})")
+        
+        lines.extend([
+            "    if missing_required_fields:",
+            "        logger.warning('Missing required fields in data: ' + ', '.join(missing_required_fields))",
+            "    return transformed_data",
+        ])
+        
+        namespace = {
+            "_apply_rule": FieldMappingService._apply_transformation_rule,
+            "logger": logger,
+        }
+        exec("\n".join(lines), namespace)
+        return namespace["_apply_mappings"]
+    
+    @staticmethod
+    def _apply_transformation_rule(value: Any, transformation_rule: str, ssot_field: str) -> Any:
+        """
+        Apply a simple transformation rule to a mapped value.
+        
+        Args:
+            value: Value read from the SSOT field
+            transformation_rule: Name of the rule to apply
+            ssot_field: Source field name, used for logging
+            
+        Returns:
+            Transformed value, or the original value if the rule fails
+        """
+        try:
+            # Simple transformation rules
+            if transformation_rule == "uppercase":
+                return str(value).upper()
+            elif transformation_rule == "lowercase":
+                return str(value).lower()
+            elif transformation_rule == "capitalize":
+                return str(value).capitalize()
+            elif transformation_rule == "boolean":
+                return bool(value)
+            elif transformation_rule == "integer":
+                return int(value) if value else 0
+            elif transformation_rule == "string":
+                return str(value) if value is not None else ""
+            # More complex rules can be added here
+        except Exception as e:
+            logger.warning(f"Error applying transformation rule '{transformation_rule}' to field '{ssot_field}': {str(e)}")
+        return value
+    
     @staticmethod
     def apply_nested_field_mappings(data: Dict[str, Any], mappings: List[Dict[str, Any]], 
                                    target_parent: str) -> Dict[str, Any]:
@@ -134,7 +242,25 @@ class FieldMappingService:
             Transformed data dictionary with nested structure
         """
         transformed_data = {}
-        nested_data = {}
+        FieldMappingService.apply_nested_field_mappings_into(data, mappings, target_parent, transformed_data)
+        return transformed_data
+    
+    @staticmethod
+    def apply_nested_field_mappings_into(data: Dict[str, Any], mappings: List[Dict[str, Any]],
+                                        target_parent: str, target: Dict[str, Any]) -> None:
+        """
+        Apply field mappings in place, writing nested values under target[target_parent].
+        
+        The nested object is created (or extended) only when at least one of its
+        fields is present in the source data.
+        
+        Args:
+            data: Source data dictionary (SSOT format)
+            mappings: List of field mapping dictionaries
+            target_parent: Name of the parent object in target format (e.g., 'user_info')
+            target: Dictionary to write the mapped fields into
+        """
+        nested_data = None
         
         for mapping in mappings:
             ssot_field = mapping["ssot_field"]
@@ -146,17 +272,12 @@ class FieldMappingService:
                 
                 # Only process if this is the parent we're looking for
                 if parent == target_parent and ssot_field in data:
-                    value = data[ssot_field]
-                    nested_data[child] = value
+                    if nested_data is None:
+                        nested_data = target.setdefault(target_parent, {})
+                    nested_data[child] = data[ssot_field]
             elif ssot_field in data:
                 # Keep non-nested fields in the root
-                transformed_data[target_field] = data[ssot_field]
-        
-        # Add the nested object to the transformed data
-        if nested_data:
-            transformed_data[target_parent] = nested_data
-            
-        return transformed_data
+                target[target_field] = data[ssot_field]
     
     @staticmethod
     def create_or_update_field_mapping(mapping_data: Dict[str, Any], db: Optional[Session] = None) -> Dict[str, Any]:
@@ -185,6 +306,7 @@ class FieldMappingService:
                     if hasattr(existing, key):
                         setattr(existing, key, value)
                 db.commit()
+                FieldMappingService.clear_field_mappings_cache()
                 logger.info(f"Updated field mapping {existing.id}")
                 result = {
                     "id": existing.id,
@@ -196,6 +318,7 @@ class FieldMappingService:
                 db.add(new_mapping)
                 db.commit()
                 db.refresh(new_mapping)
+                FieldMappingService.clear_field_mappings_cache()
                 logger.info(f"Created new field mapping {new_mapping.id}")
                 result = {
                     "id": new_mapping.id,
@@ -229,6 +352,7 @@ class FieldMappingService:
             if mapping:
                 db.delete(mapping)
                 db.commit()
+                FieldMappingService.clear_field_mappings_cache()
                 logger.info(f"Deleted field mapping {mapping_id}")
                 return {"id": mapping_id, "action": "deleted"}
             else:
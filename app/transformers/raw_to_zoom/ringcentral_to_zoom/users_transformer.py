@@ -28,7 +28,7 @@ class RingCentralToZoomUsersTransformer(BaseTransformer):
         self.transformation_config = self.get_transformation_config(self.job_type_code)
         
         # Initialize ZoomTransformerHelper for complex transformations
-        self.helper = ZoomTransformerHelper()
+        self.helper = ZoomTransformerHelper.shared()
         
         self.logger.info(f"RingCentralToZoomUsersTransformer initialized for job_type_code: {self.job_type_code}")
     
@@ -36,7 +36,7 @@ class SSOTToZoomAutoReceptionistsTransformer(BaseTransformer):
         self.transformation_config = self.get_transformation_config(self.job_type_code)
         
         # Initialize ZoomTransformerHelper for complex transformations
-        self.helper = ZoomTransformerHelper()
+        self.helper = ZoomTransformerHelper.shared()
         
         # Get database session
         self.db = next(get_db())
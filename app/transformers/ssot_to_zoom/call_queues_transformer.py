@@ -1,6 +1,6 @@
 # app/transformers/ssot_to_zoom/call_queues_transformer.py
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import time
 import logging
 
@@ -25,6 +25,17 @@ class SSOTToZoomCallQueuesTransformer(BaseTransformer):
         'sunday': 'sunday'
     }
 
+    # Output layout for a single queue; copied per queue and filled in
+    _QUEUE_TEMPLATE = {
+        'id': None,
+        'name': None,
+        'description': '',
+        'extension_number': None,
+        'business_hours': None,
+        'members': None,
+        'settings': None
+    }
+
     def __init__(self):
         super().__init__()
         self.job_type_code = 'ssot_to_zoom_call_queues'
@@ -42,29 +53,22 @@ class SSOTToZoomCallQueuesTransformer(BaseTransformer):
         Raises:
             ValueError: If required fields are missing or invalid
         """
-        try:
-            # Validate input data
-            self._validate_input_data(data)
-
-            # Extract call queue data
-            call_queues = data.get('call_queues', [])
-
-            transformed_queues = []
-            for queue in call_queues:
-                transformed_queue = self._transform_single_queue(queue)
-                transformed_queues.append(transformed_queue)
-
-            return {
-                'call_queues': transformed_queues,
-                'metadata': {
-                    'job_type_code': self.job_type_code,
-                    'transformed_count': len(transformed_queues)
-                }
-            }
+        # Validate input data
+        self._validate_input_data(data)
 
-        except Exception as e:
-            logger.error(f"Error transforming SSOT call queue data: {str(e)}")
-            raise ValueError(f"Transformation failed: {str(e)}")
+        # Extract call queue data
+        call_queues = data.get('call_queues', [])
+
+        transform_single_queue = self._transform_single_queue
+        transformed_queues = [transform_single_queue(queue) for queue in call_queues]
+
+        return {
+            'call_queues': transformed_queues,
+            'metadata': {
+                'job_type_code': self.job_type_code,
+                'transformed_count': len(transformed_queues)
+            }
+        }
 
     def _validate_input_data(self, data: Dict[str, Any]) -> None:
         """Validate the input data structure."""
@@ -92,15 +96,14 @@ class SSOTToZoomCallQueuesTransformer(BaseTransformer):
         business_hours = self._transform_business_hours(queue.get('business_hours', {}))
 
         # Transform other fields as needed
-        transformed = {
-            'id': queue_id,
-            'name': name,
-            'description': queue.get('description', ''),
-            'extension_number': queue.get('extension_number'),
-            'business_hours': business_hours,
-            'members': queue.get('members', []),
-            'settings': queue.get('settings', {})
-        }
+        transformed = self._QUEUE_TEMPLATE.copy()
+        transformed['id'] = queue_id
+        transformed['name'] = name
+        transformed['description'] = queue.get('description', '')
+        transformed['extension_number'] = queue.get('extension_number')
+        transformed['business_hours'] = business_hours
+        transformed['members'] = queue.get('members', [])
+        transformed['settings'] = queue.get('settings', {})
 
         return transformed
 
@@ -123,10 +126,22 @@ class SSOTToZoomCallQueuesTransformer(BaseTransformer):
             weekly_hours = business_hours.get('weekly_hours', {})
             transformed_weekly = {}
 
+            # Bind lookups once; this loop runs for every day of every queue
+            weekday_mapping = self.WEEKDAY_MAPPING
+            transform_day_hours = self._transform_day_hours
+
             for day, hours in weekly_hours.items():
-                if day.lower() in self.WEEKDAY_MAPPING:
-                    zoom_day = self.WEEKDAY_MAPPING[day.lower()]
-                    transformed_weekly[zoom_day] = self._transform_day_hours(hours)
+                zoom_day = weekday_mapping.get(day.lower())
+                if zoom_day is not None:
+                    enabled, start_time, end_time = transform_day_hours(hours)
+                    if enabled:
+                        transformed_weekly[zoom_day] = {
+                            'enabled': True,
+                            'start_time': start_time,
+                            'end_time': end_time
+                        }
+                    else:
+                        transformed_weekly[zoom_day] = {'enabled': False}
 
             transformed_hours['weekly_hours'] = transformed_weekly
 
@@ -140,36 +155,40 @@ class SSOTToZoomCallQueuesTransformer(BaseTransformer):
 
         return transformed_hours
 
-    def _transform_day_hours(self, day_hours: Dict[str, Any]) -> Dict[str, Any]:
-        """Transform hours for a single day."""
-        if not day_hours.get('enabled', True):
-            return {'enabled': False}
+    def _transform_day_hours(
+        self, day_hours: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Transform hours for a single day.
 
-        start_time = day_hours.get('start_time')
-        end_time = day_hours.get('end_time')
+        Returns:
+            (enabled, start_time, end_time); the caller builds the output dict
+        """
+        get = day_hours.get
+        if not get('enabled', True):
+            return False, None, None
+
+        start_time, end_time = get('start_time'), get('end_time')
 
         if start_time and end_time:
             # Convert to Zoom's expected time format if needed
-            return {
-                'enabled': True,
-                'start_time': self._format_time(start_time),
-                'end_time': self._format_time(end_time)
-            }
+            format_time = self._format_time
+            return True, format_time(start_time), format_time(end_time)
 
-        return {'enabled': False}
+        return False, None, None
 
     def _transform_holidays(self, holidays: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Transform holiday data."""
-        transformed_holidays = []
-        for holiday in holidays:
-            transformed_holiday = {
+        format_time = self._format_time
+        return [
+            {
                 'name': holiday.get('name', ''),
                 'date': holiday.get('date'),
-                'start_time': self._format_time(holiday.get('start_time')),
-                'end_time': self._format_time(holiday.get('end_time'))
+                'start_time': format_time(holiday.get('start_time')),
+                'end_time': format_time(holiday.get('end_time'))
             }
-            transformed_holidays.append(transformed_holiday)
-        return transformed_holidays
+            for holiday in holidays
+        ]
 
     def _format_time(self, time_str: Optional[str]) -> Optional[str]:
         """Format time string to Zoom's expected format."""
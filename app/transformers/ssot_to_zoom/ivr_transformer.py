@@ -3,7 +3,7 @@ SSOT to Zoom IVR Transformer
 
 This transformer converts SSOT IVR data to Zoom IVR format.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 from app.transformers.base_transformer import BaseTransformer
@@ -22,6 +22,16 @@ class SSOTToZoomIVRTransformer(BaseTransformer):
     central data store to the format required by Zoom's API.
     """
     
+    # IVR fields that need special handling, keyed by their ivr_setting key.
+    # Values name the ZoomTransformerHelper method applied to the source value
+    # (None copies the value as-is).
+    SPECIAL_FIELD_HANDLERS = {
+        "site_id": None,
+        "audio_prompt": "transform_ivr_audio_prompt",
+        "menu_options": "transform_ivr_menu_options",
+        "hours_of_operation": "transform_hours_of_operation",
+    }
+    
     def __init__(self):
         """Initialize the SSOTToZoomIVRTransformer."""
         super().__init__()
@@ -36,7 +46,7 @@ class SSOTToZoomIVRTransformer(BaseTransformer):
         self.transformation_config = self.get_transformation_config(self.job_type_code)
         
         # Initialize ZoomTransformerHelper for complex transformations
-        self.helper = ZoomTransformerHelper()
+        self.helper = ZoomTransformerHelper.shared()
         
         # Get database session
         self.db = next(get_db())
@@ -49,6 +59,10 @@ class SSOTToZoomIVRTransformer(BaseTransformer):
             db=self.db
         )
         
+        # Specialize mapping application for this job type's field mappings
+        self._apply_mappings = FieldMappingService.compile_field_mappings(self.field_mappings)
+        self._special_fields = self._classify_special_fields(self.field_mappings)
+        
         self.logger.info(f"SSOTToZoomIVRTransformer initialized for job_type_code: {self.job_type_code}")
     
     def transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -66,72 +80,61 @@ class SSOTToZoomIVRTransformer(BaseTransformer):
             raise ValueError("Invalid input data for SSOT IVR transformation")
         
         # Apply field mappings to transform data
-        transformed = FieldMappingService.apply_field_mappings(data, self.field_mappings)
+        transformed = self._apply_mappings(data)
         
         # Add required base structure if not present
         if "ivr_setting" not in transformed:
             transformed["ivr_setting"] = {}
+        setting = transformed["ivr_setting"]
         
         # Map complex fields that require special handling
-        
-        # Handle site/location mapping
-        site_id_field = next((m["ssot_field"] for m in self.field_mappings 
-                             if m["target_field"] == "site_id" or m["target_field"] == "ivr_setting.site_id"), None)
-        
-        if site_id_field and site_id_field in data:
-            site_id = data.get(site_id_field)
-            if "ivr_setting" in transformed:
-                transformed["ivr_setting"]["site_id"] = site_id
-            else:
-                transformed["site_id"] = site_id
-        
-        # Handle audio prompt
-        audio_prompt_field = next((m["ssot_field"] for m in self.field_mappings 
-                                  if m["target_field"] == "audio_prompt" or m["target_field"] == "ivr_setting.audio_prompt"), None)
-        
-        if audio_prompt_field and audio_prompt_field in data:
-            audio_prompt_data = data.get(audio_prompt_field)
-            if audio_prompt_data:
-                transformed_prompt = self.helper.transform_ivr_audio_prompt(audio_prompt_data)
-                if "ivr_setting" in transformed:
-                    transformed["ivr_setting"]["audio_prompt"] = transformed_prompt
-                else:
-                    transformed["audio_prompt"] = transformed_prompt
-        
-        # Handle menu options
-        menu_options_field = next((m["ssot_field"] for m in self.field_mappings 
-                                  if m["target_field"] == "menu_options" or m["target_field"] == "ivr_setting.menu_options"), None)
-        
-        if menu_options_field and menu_options_field in data:
-            menu_options_data = data.get(menu_options_field)
-            if menu_options_data:
-                transformed_options = self.helper.transform_ivr_menu_options(menu_options_data)
-                if "ivr_setting" in transformed:
-                    transformed["ivr_setting"]["menu_options"] = transformed_options
-                else:
-                    transformed["menu_options"] = transformed_options
-        
-        # Handle hours of operation
-        hours_field = next((m["ssot_field"] for m in self.field_mappings 
-                           if m["target_field"] == "hours_of_operation" or m["target_field"] == "ivr_setting.hours_of_operation"), None)
-        
-        if hours_field and hours_field in data:
-            hours_data = data.get(hours_field)
-            if hours_data:
-                transformed_hours = self.helper.transform_hours_of_operation(hours_data)
-                if "ivr_setting" in transformed:
-                    transformed["ivr_setting"]["hours_of_operation"] = transformed_hours
-                else:
-                    transformed["hours_of_operation"] = transformed_hours
+        for key, ssot_field, handler_name in self._special_fields:
+            if not ssot_field or ssot_field not in data:
+                continue
+            
+            value = data.get(ssot_field)
+            if handler_name:
+                if not value:
+                    continue
+                value = getattr(self.helper, handler_name)(value)
+            
+            setting[key] = value
         
         # Ensure required fields are present
         if self.validate_output(transformed):
-            self.logger.info(f"Successfully transformed SSOT IVR data: {transformed.get('name', 'unknown')}")
+            self.logger.info("Successfully transformed SSOT IVR data: %s", transformed.get('name', 'unknown'))
             return transformed
         else:
             self.logger.error(f"Transformation resulted in invalid Zoom IVR data: {transformed}")
             raise ValueError("Transformation resulted in invalid Zoom IVR data")
     
+    def _classify_special_fields(self, field_mappings: List[Dict[str, Any]]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Resolve the source field for each special IVR field in a single pass.
+        
+        Both the bare target field (e.g. 'audio_prompt') and its ivr_setting
+        form (e.g. 'ivr_setting.audio_prompt') match; the first mapping wins.
+        
+        Args:
+            field_mappings: Field mappings for this job type
+            
+        Returns:
+            List of (ivr_setting key, ssot_field, helper method name) tuples
+        """
+        source_fields = {}
+        for mapping in field_mappings:
+            key = mapping["target_field"]
+            if key.startswith("ivr_setting."):
+                key = key[len("ivr_setting."):]
+            if key in self.SPECIAL_FIELD_HANDLERS and key not in source_fields:
+                source_fields[key] = mapping["ssot_field"]
+        
+        return [
+            (key, source_fields[key], handler_name)
+            for key, handler_name in self.SPECIAL_FIELD_HANDLERS.items()
+            if key in source_fields
+        ]
+    
     def validate_input(self, data: Dict[str, Any]) -> bool:
         """
         Validate the input SSOT IVR data.
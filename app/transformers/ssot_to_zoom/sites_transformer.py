@@ -1,5 +1,4 @@
-from typing import Any, Dict, List, Optional
-import yaml
+from typing import Any, Dict
 
 from app.transformers.base_transformer import BaseTransformer
 from app.utils.zoom_transformer_ported import ZoomTransformerHelper
@@ -13,6 +12,10 @@ class SitesToZoomTransformer(BaseTransformer):
     central data store to the format required by Zoom's API.
     """
     
+    # Fields a Zoom location must carry (order is used for error reporting)
+    REQUIRED_OUTPUT_FIELDS = ("name", "address_line1", "city", "state", "country")
+    REQUIRED_OUTPUT_KEYS = frozenset(REQUIRED_OUTPUT_FIELDS)
+    
     def __init__(self, job_type_code: str = "rc_zoom_sites"):
         """
         Initialize the SitesToZoomTransformer.
@@ -30,7 +33,7 @@ class SitesToZoomTransformer(BaseTransformer):
         self.transformation_config = self.get_transformation_config(job_type_code)
         
         # Initialize ZoomTransformerHelper for complex transformations
-        self.helper = ZoomTransformerHelper()
+        self.helper = ZoomTransformerHelper.shared()
         
         self.logger.info(f"SitesToZoomTransformer initialized for job_type_code: {job_type_code}")
     
@@ -51,17 +54,13 @@ class SitesToZoomTransformer(BaseTransformer):
         # Create a copy of the input data to avoid modifying the original
         transformed = dict(data)
         
-        # Use SSOT schema field mappings if available
-        field_mappings = self.ssot_schema.get("field_mappings", {})
-        
         # Transform business address to emergency address using ZoomTransformerHelper
         if "businessAddress" in data:
             business_address = data["businessAddress"]
             emergency_address = self.helper.transform_emergency_address(business_address)
             transformed["default_emergency_address"] = emergency_address
             # Remove the original businessAddress field to avoid confusion
-            if "businessAddress" in transformed:
-                del transformed["businessAddress"]
+            transformed.pop("businessAddress", None)
             self.logger.info("Transformed emergency address using ZoomTransformerHelper")
         
         # Generate auto receptionist name with smart processing
@@ -69,7 +68,7 @@ class SitesToZoomTransformer(BaseTransformer):
             site_name = data["name"]
             ar_name = ZoomTransformerHelper.process_auto_receptionist_name(site_name)
             transformed["auto_receptionist_name"] = ar_name
-            self.logger.info(f"Generated AR name '{ar_name}' for site '{site_name}'")
+            self.logger.info("Generated AR name '%s' for site '%s'", ar_name, site_name)
         
         # Transform regional settings timezone
         if "regionalSettings" in data and isinstance(data["regionalSettings"], dict):
@@ -80,12 +79,17 @@ class SitesToZoomTransformer(BaseTransformer):
                 if isinstance(timezone_data, dict):
                     iana_timezone = self.helper.transform_timezone_to_iana(timezone_data)
                 else:
-                    iana_timezone = ZoomTransformerHelper.convert_to_iana_timezone(str(timezone_data))
+                    # Known RingCentral names resolve straight from the table
+                    timezone_name = str(timezone_data)
+                    iana_timezone = (
+                        ZoomTransformerHelper.RC_TO_IANA_MAPPING.get(timezone_name)
+                        or ZoomTransformerHelper.convert_to_iana_timezone(timezone_name)
+                    )
                 
                 if iana_timezone:
                     regional_settings["timezone"] = iana_timezone
                     transformed["regionalSettings"] = regional_settings
-                    self.logger.info(f"Converted timezone to IANA format: {iana_timezone}")
+                    self.logger.info("Converted timezone to IANA format: %s", iana_timezone)
         
         # Add additional Zoom-specific fields
         transformed["status"] = "active"
@@ -126,10 +130,14 @@ class SitesToZoomTransformer(BaseTransformer):
         Returns:
             True if data is valid, False otherwise
         """
-        # Ensure required Zoom fields are present
-        required_fields = ["name", "address_line1", "city", "state", "country"]
-        
-        for field in required_fields:
+        # Fast path: every required key present and non-empty
+        if self.REQUIRED_OUTPUT_KEYS.issubset(data) and all(
+            data[field] for field in self.REQUIRED_OUTPUT_FIELDS
+        ):
+            return True
+        
+        # Otherwise report the first missing field
+        for field in self.REQUIRED_OUTPUT_FIELDS:
             if not data.get(field):
                 self.logger.error(f"Missing required Zoom field: {field}")
                 return False
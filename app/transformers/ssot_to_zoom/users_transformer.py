@@ -2,12 +2,22 @@ from typing import Any, Dict, List, Optional
 import logging
 
 from app.transformers.base_transformer import BaseTransformer
-from app.utils.zoom_transformer_ported import ZoomTransformerHelper
+from app.utils.zoom_transformer_ported import ZoomTransformerHelper, ZOOM_TYPE_MAP as _ZOOM_TYPE_MAP
 from app.services.field_mapping_service import FieldMappingService
-from app.database.session import get_db
 
 logger = logging.getLogger(__name__)
 
+# Legacy user_info fields and the SSOT keys tried, in order, when unmapped
+_USER_INFO_FIELD_SPECS = (
+    ("first_name", ("first_name", "firstName")),
+    ("last_name", ("last_name", "lastName")),
+    ("email", ("email",)),
+    ("phone_number", ("phone_number", "phoneNumber", "business_phone")),
+)
+
+# user_info fields a Zoom user payload must carry
+_REQUIRED_USER_INFO_FIELDS = ("first_name", "last_name", "email", "type")
+
 
 class SSOTToZoomUsersTransformer(BaseTransformer):
     """
@@ -33,19 +43,29 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
         self.transformation_config = self.get_transformation_config(self.job_type_code)
         
         # Initialize ZoomTransformerHelper for complex transformations
-        self.helper = ZoomTransformerHelper()
-        
-        # Get database session
-        self.db = next(get_db())
+        self.helper = ZoomTransformerHelper.shared()
         
-        # Get field mappings
-        self.field_mappings = FieldMappingService.get_field_mappings(
+        # Get field mappings (cached across instances)
+        self.field_mappings = FieldMappingService.get_cached_field_mappings(
             job_type_id=self.job_type_id,
             source_platform="ssot",
-            target_entity=self.target_entity,
-            db=self.db
+            target_entity=self.target_entity
         )
         
+        # Precompute mapping lookups used on every record (first mapping per target wins)
+        ssot_field_by_target = {}
+        for m in self.field_mappings:
+            ssot_field_by_target.setdefault(m["target_field"], m["ssot_field"])
+        self._timezone_field = ssot_field_by_target.get("user_info.timezone")
+        self._user_type_field = ssot_field_by_target.get("user_info.type")
+        self._phone_numbers_field = ssot_field_by_target.get("phone_numbers")
+        self._user_info_mappings = [
+            m for m in self.field_mappings if m["target_field"].startswith("user_info.")
+        ]
+        self._required_ssot_fields = [
+            m["ssot_field"] for m in self.field_mappings if m.get("is_required", False)
+        ]
+        
         self.logger.info(f"SSOTToZoomUsersTransformer initialized for job_type_code: {self.job_type_code}")
     
     def transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,14 +89,12 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
             
             # Check if we need to create a user_info structure
             if "user_info" not in transformed:
-                # Get all mappings for user_info fields
-                user_info_mappings = [m for m in self.field_mappings if m["target_field"].startswith("user_info.")]
-                
                 # Apply nested field mappings to create user_info structure
+                user_info_mappings = self._user_info_mappings
                 if user_info_mappings:
-                    user_info_data = FieldMappingService.apply_nested_field_mappings(data, user_info_mappings, "user_info")
-                    # Merge with existing transformed data
-                    transformed.update(user_info_data)
+                    FieldMappingService.apply_nested_field_mappings_into(
+                        data, user_info_mappings, "user_info", transformed
+                    )
         else:
             # Fall back to old transformation logic
             # Create a copy of the input data to avoid modifying the original
@@ -88,26 +106,13 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
             # Build the user_info structure
             user_info = {}
             
-            # Map standard fields using schema mappings
-            if "first_name" in field_mappings and field_mappings["first_name"] in data:
-                user_info["first_name"] = data.get(field_mappings["first_name"], "")
-            else:
-                user_info["first_name"] = data.get("first_name", data.get("firstName", ""))
-            
-            if "last_name" in field_mappings and field_mappings["last_name"] in data:
-                user_info["last_name"] = data.get(field_mappings["last_name"], "")
-            else:
-                user_info["last_name"] = data.get("last_name", data.get("lastName", ""))
-            
-            if "email" in field_mappings and field_mappings["email"] in data:
-                user_info["email"] = data.get(field_mappings["email"], "")
-            else:
-                user_info["email"] = data.get("email", "")
-            
-            if "phone_number" in field_mappings and field_mappings["phone_number"] in data:
-                user_info["phone_number"] = data.get(field_mappings["phone_number"], "")
-            else:
-                user_info["phone_number"] = data.get("phone_number", data.get("phoneNumber", data.get("business_phone", "")))
+            # Map standard fields using schema mappings, else the first known alias
+            for target, fallbacks in _USER_INFO_FIELD_SPECS:
+                source = field_mappings.get(target)
+                if source is not None and source in data:
+                    user_info[target] = data[source]
+                else:
+                    user_info[target] = next((data[f] for f in fallbacks if f in data), "")
             
             # Add the user_info object to the transformed data
             transformed["user_info"] = user_info
@@ -115,13 +120,10 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
         # Handle special fields and complex transformations regardless of mapping approach
         
         # Check if user_info exists, create if not
-        if "user_info" not in transformed:
-            transformed["user_info"] = {}
-            
+        user_info = transformed.setdefault("user_info", {})
+        
         # Handle timezone conversion
-        timezone_field = next((m["ssot_field"] for m in self.field_mappings 
-                              if m["target_field"] == "user_info.timezone"), None)
-                              
+        timezone_field = self._timezone_field
         if timezone_field and timezone_field in data:
             timezone_data = data.get(timezone_field)
             if timezone_data:
@@ -132,47 +134,45 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
                     iana_timezone = ZoomTransformerHelper.convert_to_iana_timezone(str(timezone_data))
                 
                 if iana_timezone:
-                    transformed["user_info"]["timezone"] = iana_timezone
-                    self.logger.info(f"Converted timezone to IANA format: {iana_timezone}")
+                    user_info["timezone"] = iana_timezone
+                    self.logger.info("Converted timezone to IANA format: %s", iana_timezone)
         
         # Handle user type mapping
-        user_type_field = next((m["ssot_field"] for m in self.field_mappings 
-                               if m["target_field"] == "user_info.type"), None)
-                               
+        user_type_field = self._user_type_field
         if user_type_field and user_type_field in data:
             user_type = data.get(user_type_field)
             if user_type:
-                zoom_type = ZoomTransformerHelper.map_user_type_to_zoom(user_type)
-                transformed["user_info"]["type"] = zoom_type
-                self.logger.info(f"Mapped user type {user_type} to Zoom type {zoom_type}")
+                zoom_type = _ZOOM_TYPE_MAP.get(user_type)
+                if zoom_type is None:
+                    # Unknown types go through the helper for its warning and default
+                    zoom_type = ZoomTransformerHelper.map_user_type_to_zoom(user_type)
+                user_info["type"] = zoom_type
+                self.logger.info("Mapped user type %s to Zoom type %s", user_type, zoom_type)
         
         # Set default user type if not already set
-        if "type" not in transformed.get("user_info", {}):
-            transformed["user_info"]["type"] = 1  # Default to regular user
+        if "type" not in user_info:
+            user_info["type"] = 1  # Default to regular user
             self.logger.info("Set default user_info.type = 1")
         
         # Format phone numbers if available
-        phone_numbers_field = next((m["ssot_field"] for m in self.field_mappings 
-                                   if m["target_field"] == "phone_numbers"), None)
-                                   
+        phone_numbers_field = self._phone_numbers_field
         if phone_numbers_field and phone_numbers_field in data:
             phone_numbers = data.get(phone_numbers_field)
             if phone_numbers and isinstance(phone_numbers, list):
                 formatted_numbers = ZoomTransformerHelper.format_user_phone_numbers(phone_numbers)
                 if formatted_numbers:
                     transformed["phone_numbers"] = formatted_numbers
-                    self.logger.info(f"Formatted {len(formatted_numbers)} phone numbers")
+                    self.logger.info("Formatted %d phone numbers", len(formatted_numbers))
         
         # Generate display name from first and last name if not already set
         if "display_name" not in transformed:
-            user_info = transformed.get("user_info", {})
             display_name = ZoomTransformerHelper.concat_user_display_name(
                 user_info.get("first_name", ""),
                 user_info.get("last_name", "")
             )
             if display_name:
                 transformed["display_name"] = display_name
-                self.logger.info(f"Generated display name '{display_name}'")
+                self.logger.info("Generated display name '%s'", display_name)
         
         # Add additional Zoom-specific fields if not already set
         if "status" not in transformed:
@@ -182,9 +182,25 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
             self.logger.error(f"Invalid output data: {transformed}")
             raise ValueError("Transformation resulted in invalid Zoom user data")
         
-        self.logger.info(f"Successfully transformed SSOT user data for user {transformed.get('id', 'unknown')}")
+        self.logger.info("Successfully transformed SSOT user data for user %s", transformed.get('id', 'unknown'))
         return transformed
     
+    def transform_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Transform a list of SSOT user records to Zoom user format.
+        
+        Mapping lookups are resolved once at init, so a batch only pays the
+        per-record work in transform().
+        
+        Args:
+            records: SSOT user data dictionaries
+            
+        Returns:
+            List of dictionaries in Zoom user format, in input order
+        """
+        transform = self.transform
+        return [transform(record) for record in records]
+    
     def validate_input(self, data: Dict[str, Any]) -> bool:
         """
         Validate the input SSOT user data.
@@ -197,9 +213,7 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
         """
         # If we have field mappings, check required fields based on them
         if self.field_mappings:
-            required_fields = [m["ssot_field"] for m in self.field_mappings if m.get("is_required", False)]
-            
-            for field in required_fields:
+            for field in self._required_ssot_fields:
                 if field not in data:
                     self.logger.error(f"Missing required field: {field}")
                     return False
@@ -238,8 +252,7 @@ class SSOTToZoomUsersTransformer(BaseTransformer):
             self.logger.error("Missing or invalid user_info object")
             return False
         
-        required_fields = ["first_name", "last_name", "email", "type"]
-        for field in required_fields:
+        for field in _REQUIRED_USER_INFO_FIELDS:
             if not data["user_info"].get(field):
                 self.logger.error(f"Missing required Zoom field: user_info.{field}")
                 return False
@@ -7,6 +7,8 @@ validating addresses across different platforms.
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,9 @@ COUNTRY_MAPPING = {
     'Mexico': 'MX'
 }
 
+# Lowercase-keyed view of COUNTRY_MAPPING for case-insensitive lookups
+_COUNTRY_MAPPING_CI = {name.lower(): code for name, code in COUNTRY_MAPPING.items()}
+
 # Address field replacements for normalization
 ADDRESS_REPLACEMENTS = {
     ' Po ': ' PO ',      # PO Box
@@ -60,6 +65,26 @@ ADDRESS_END_REPLACEMENTS = {
     ' Rd': ' RD',
 }
 
+# US ZIP code: 5 digits, or ZIP+4 written without a separator
+_US_ZIP_RE = re.compile(r'\d{5}(?:\d{4})?', re.ASCII)
+
+# Address fields whose values get abbreviation/casing normalization
+_NORMALIZED_ADDRESS_FIELDS = frozenset(('street', 'street2', 'city'))
+
+# Both tables above compiled into one pattern so normalization is a single pass.
+# Mid-string tokens must be followed by a space; end tokens must end the string.
+_ADDRESS_TOKEN_MAP = {
+    old.strip(): new.strip()
+    for table in (ADDRESS_REPLACEMENTS, ADDRESS_END_REPLACEMENTS)
+    for old, new in table.items()
+}
+_ADDRESS_TOKEN_RE = re.compile(
+    r'(?<= )(?:(?:{mid})(?= )|(?:{end})$)'.format(
+        mid='|'.join(old.strip() for old in ADDRESS_REPLACEMENTS),
+        end='|'.join(old.strip() for old in ADDRESS_END_REPLACEMENTS),
+    )
+)
+
 
 def convert_country_to_iso(country_name: str) -> str:
     """
@@ -69,9 +94,11 @@ def convert_country_to_iso(country_name: str) -> str:
         country_name: Country name to convert
         
     Returns:
-        ISO country code
+        ISO country code, the input unchanged if unknown, or '' if empty
     """
-    return COUNTRY_MAPPING.get(country_name, country_name)
+    if not country_name:
+        return ''
+    return _COUNTRY_MAPPING_CI.get(country_name.lower(), country_name)
 
 
 def normalize_address_field(value: str) -> str:
@@ -87,19 +114,15 @@ def normalize_address_field(value: str) -> str:
     if not value or not isinstance(value, str):
         return value
     
-    # First apply title case
-    normalized = value.title()
-    
-    # Handle common abbreviations and special cases
-    for old, new in ADDRESS_REPLACEMENTS.items():
-        normalized = normalized.replace(old, new)
-    
-    # Handle cases at the end of string
-    for old, new in ADDRESS_END_REPLACEMENTS.items():
-        if normalized.endswith(old):
-            normalized = normalized[:-len(old)] + new
-    
-    return normalized
+    return _normalize_address_string(value)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_address_string(value: str) -> str:
+    """Title case, then upper-case known abbreviations in one pass (cached)."""
+    return _ADDRESS_TOKEN_RE.sub(
+        lambda match: _ADDRESS_TOKEN_MAP[match.group(0)], value.title()
+    )
 
 
 def transform_emergency_address(business_address: Dict[str, Any]) -> Dict[str, Any]:
@@ -117,8 +140,7 @@ def transform_emergency_address(business_address: Dict[str, Any]) -> Dict[str, A
         
     try:
         # Get country and convert to ISO code
-        country_name = business_address.get('country', '')
-        country_iso = convert_country_to_iso(country_name) if country_name else ''
+        country_iso = convert_country_to_iso(business_address.get('country'))
         
         transformed_address = {
             'address_line1': business_address.get('street', ''),
@@ -161,12 +183,13 @@ def apply_address_transformation(record: Dict[str, Any], transform_config: Dict[
             # Handle static boolean values
             if isinstance(source_field, bool):
                 address[target_field] = source_field
-            elif source_field in record and record[source_field]:
+                continue
+            value = record.get(source_field)
+            if value:
                 # Normalize street and city fields
-                if target_field in ['street', 'street2', 'city']:
-                    address[target_field] = normalize_address_field(record[source_field])
-                else:
-                    address[target_field] = record[source_field]
+                if target_field in _NORMALIZED_ADDRESS_FIELDS:
+                    value = normalize_address_field(value)
+                address[target_field] = value
             else:
                 missing_fields.append(target_field)
         
@@ -178,12 +201,13 @@ def apply_address_transformation(record: Dict[str, Any], transform_config: Dict[
                     # Handle static boolean values
                     if isinstance(source_field, bool):
                         address[target_field] = source_field
-                    elif source_field in record and record[source_field]:
+                        continue
+                    value = record.get(source_field)
+                    if value:
                         # Normalize street and city fields
-                        if target_field in ['street', 'street2', 'city']:
-                            address[target_field] = normalize_address_field(record[source_field])
-                        else:
-                            address[target_field] = record[source_field]
+                        if target_field in _NORMALIZED_ADDRESS_FIELDS:
+                            value = normalize_address_field(value)
+                        address[target_field] = value
         
         return address
         
@@ -225,12 +249,10 @@ def validate_address(address: Dict[str, Any], required_fields: List[str] = None)
             validation_result['warnings'].append(f"Country code '{country}' is not in ISO 3166-1 alpha-2 format")
     
     # Validate ZIP/postal code
-    if 'zip' in address and address['zip']:
-        zip_code = address['zip']
-        country = address.get('country', '')
-        
+    zip_code = address.get('zip')
+    if zip_code:
         # US ZIP code validation
-        if country == 'US' and (not zip_code.isdigit() or (len(zip_code) != 5 and len(zip_code) != 9)):
+        if address.get('country') == 'US' and not _US_ZIP_RE.fullmatch(zip_code):
             validation_result['warnings'].append(f"ZIP code '{zip_code}' does not match US format (5 or 9 digits)")
     
     return validation_result
\ No newline at end of file
@@ -2,11 +2,28 @@
 JSON Formatter for Structured Logging to Elasticsearch
 Usage: Import and configure in your FastAPI/Django applications
 """
-import logging
+import copy
 import json
+import logging
+import logging.handlers
+import queue
 from datetime import datetime
 import traceback
 
+import orjson
+
+# Naive datetimes are UTC and are rendered with a trailing "Z"; non-str dict keys are allowed
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# LogRecord attributes (and context fields) that are not copied in as extras
+_RESERVED_RECORD_ATTRS = frozenset((
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'message', 'pathname', 'process', 'processName', 'relativeCreated',
+    'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
+    'service', 'platform', 'component',
+))
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -34,25 +51,46 @@ class JSONFormatter(logging.Formatter):
         Returns:
             str: JSON-formatted log entry
         """
+        return self.format_bytes(record).decode()
+
+    def format_bytes(self, record):
+        """
+        Format a log record as UTF-8 encoded JSON, without a str round trip.
+
+        Records orjson cannot encode (lone surrogates, integers wider than
+        64 bits) are encoded with the json module instead, as before.
+
+        Args:
+            record: LogRecord object
+
+        Returns:
+            bytes: JSON-formatted log entry
+        """
+        record_dict = record.__dict__
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcnow(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
-            "service": record.__dict__.get('service', 'unknown'),
-            "platform": record.__dict__.get('platform', 'unknown'),
-            "component": record.__dict__.get('component', 'unknown'),
+            "service": record_dict.get('service', 'unknown'),
+            "platform": record_dict.get('platform', 'unknown'),
+            "component": record_dict.get('component', 'unknown'),
         }
 
         # Add exception information if present
-        if record.exc_info:
+        exc_info = record.exc_info
+        if exc_info:
+            # Reuse the traceback text cached on the record by an earlier format
+            if not record.exc_text:
+                record.exc_text = self.formatException(exc_info)
+            exc_type, exc_value = exc_info[0], exc_info[1]
             log_data["exception"] = {
-                "type": record.exc_info[0].__name__,
-                "message": str(record.exc_info[1]),
-                "traceback": self.formatException(record.exc_info)
+                "type": exc_type.__name__,
+                "message": str(exc_value),
+                "traceback": record.exc_text
             }
 
         # Add stack info if present
@@ -60,20 +98,109 @@ class JSONFormatter(logging.Formatter):
             log_data["stack_info"] = record.stack_info
 
         # Add any extra fields passed to the logger
-        for key, value in record.__dict__.items():
-            if key not in ('name', 'msg', 'args', 'created', 'filename', 'funcName',
-                          'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                          'message', 'pathname', 'process', 'processName', 'relativeCreated',
-                          'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
-                          'service', 'platform', 'component'):
+        for key, value in record_dict.items():
+            if key not in _RESERVED_RECORD_ATTRS:
                 try:
                     # Only add JSON-serializable values
-                    json.dumps(value)
-                    log_data[key] = value
-                except (TypeError, ValueError):
-                    log_data[key] = str(value)
+                    orjson.dumps(value, option=_ORJSON_OPTIONS)
+                except orjson.JSONEncodeError:
+                    try:
+                        json.dumps(value)
+                    except (TypeError, ValueError):
+                        value = str(value)
+                log_data[key] = value
+
+        try:
+            return orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            log_data["timestamp"] = log_data["timestamp"].isoformat() + "Z"
+            return json.dumps(log_data, default=str).encode()
+
+
+class JSONBytesHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes JSONFormatter output as bytes to the stream's buffer.
+
+    Skips the str decode/encode round trip of a text stream. Streams without
+    a binary buffer (e.g. StringIO) get the decoded line instead.
+
+    Usage:
+        handler = JSONBytesHandler()  # stderr, JSONFormatter preset
+        logging.basicConfig(handlers=[handler], level=logging.INFO)
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.setFormatter(JSONFormatter())
+
+    def emit(self, record):
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, JSONFormatter):
+                data = formatter.format_bytes(record)
+            else:
+                data = self.format(record).encode()
+
+            stream = self.stream
+            buffer = getattr(stream, 'buffer', None)
+            if buffer is None:
+                stream.write(data.decode() + self.terminator)
+                stream.flush()
+            else:
+                # Flush pending text first so lines written through the wrapper stay ordered
+                stream.flush()
+                buffer.write(data + b'\n')
+                buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _JSONQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers all formatting, exceptions included, to the listener."""
+
+    def prepare(self, record):
+        """Merge args into the message now; leave exc_info for JSONFormatter."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def configure_async_json_logging(level=logging.INFO, handler=None):
+    """
+    Route root logging through a queue so JSON formatting and I/O run off the caller thread.
+
+    Callers only enqueue the record; a QueueListener thread formats it with
+    JSONFormatter and writes it to the real handler.
+
+    Usage:
+        listener = configure_async_json_logging()
+        ...
+        listener.stop()  # on shutdown, flushes queued records
+
+    Args:
+        level: Root logger level
+        handler: Destination handler (default: JSONBytesHandler to stderr)
+
+    Returns:
+        logging.handlers.QueueListener: The started listener
+    """
+    if handler is None:
+        handler = JSONBytesHandler()
+    else:
+        handler.setFormatter(JSONFormatter())
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [_JSONQueueHandler(log_queue)]
+    root.setLevel(level)
 
-        return json.dumps(log_data)
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
 
 
 class LoggerAdapter(logging.LoggerAdapter):
@@ -1,28 +1,65 @@
 #!/usr/bin/env python3
 
 import redis
-import json
+import orjson
 import os
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
+from redis.commands.core import Script
+
+from .redis_client import DEFAULT_REDIS_HOST, get_connection_pool
 
 load_dotenv()
 
+# Provider fields stored as JSON strings / as 'True'/'False'
+_JSON_FIELDS = frozenset({'scopes', 'features_enabled'})
+_BOOL_FIELDS = frozenset({'sync_enabled'})
+
+# HSET only if the hash already exists; returns 1 if written, 0 if the key was missing
+_HSET_IF_EXISTS = Script(None, b"""
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+""")
+
+
+# Per-process cache of each tenant's provider names:
+# {(host, port, db, tenant_id): (expires_at, names)}, so managers for different
+# Redis servers or databases never share entries.
+# Entries are dropped on add/delete here; other workers see changes within the TTL.
+_PROVIDERS_CACHE_TTL = 30
+_PROVIDERS_CACHE_MAX_TENANTS = 1024
+_providers_cache: Dict[tuple, tuple] = {}
+
+
+def _s(value: Any, default: str = '') -> str:
+    # Coerce a config value to the str Redis stores, skipping str() for str inputs
+    if isinstance(value, str):
+        return value
+    return default if value is None else str(value)
+
+
+def _flatten_mapping(mapping: Dict[str, Any]) -> List[Any]:
+    return [item for pair in mapping.items() for item in pair]
+
 
 class ProviderManager:
-    def __init__(self, redis_host='localhost', redis_port=6379, redis_db=0):
+    def __init__(self, redis_host=DEFAULT_REDIS_HOST, redis_port=6379, redis_db=0):
         self.redis_client = redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            db=redis_db,
-            decode_responses=True
+            connection_pool=get_connection_pool(redis_host, redis_port, redis_db)
         )
 
     def get_tenant_key(self, tenant_id: str) -> str:
         return f"tenant:{tenant_id}"
 
-    def get_provider_key(self, tenant_id: str, provider: str) -> str:
+    @staticmethod
+    def get_provider_key(tenant_id: str, provider: str) -> str:
         return f"tenant:{tenant_id}:provider:{provider}"
 
     def get_providers_set_key(self, tenant_id: str) -> str:
@@ -42,32 +79,36 @@ class ProviderManager:
     ) -> bool:
         provider_key = self.get_provider_key(tenant_id, provider)
         providers_set_key = self.get_providers_set_key(tenant_id)
+        now = datetime.utcnow().isoformat() + 'Z'
 
         provider_data = {
             'provider_type': provider,
             'status': config.get('status', 'active'),
             'auth_type': config.get('auth_type', 'api_key'),
-            'api_key': str(config.get('api_key', '')),
-            'api_secret': str(config.get('api_secret', '')),
-            'account_id': str(config.get('account_id', '')),
-            'access_token': str(config.get('access_token', '')),
-            'refresh_token': str(config.get('refresh_token', '')),
-            'token_expiry': str(config.get('token_expiry', '')),
-            'scopes': json.dumps(config.get('scopes', [])),
-            'api_base_url': str(config.get('api_base_url', 'https://api.zoom.us/v2')),
-            'rate_limit_window': str(config.get('rate_limit_window', '60')),
-            'rate_limit_calls': str(config.get('rate_limit_calls', '40')),
-            'webhook_url': str(config.get('webhook_url', '')),
-            'features_enabled': json.dumps(config.get('features_enabled', [])),
+            'api_key': _s(config.get('api_key')),
+            'api_secret': _s(config.get('api_secret')),
+            'account_id': _s(config.get('account_id')),
+            'access_token': _s(config.get('access_token')),
+            'refresh_token': _s(config.get('refresh_token')),
+            'token_expiry': _s(config.get('token_expiry')),
+            'scopes': orjson.dumps(config.get('scopes', []), option=orjson.OPT_NON_STR_KEYS).decode(),
+            'api_base_url': _s(config.get('api_base_url'), 'https://api.zoom.us/v2'),
+            'rate_limit_window': _s(config.get('rate_limit_window'), '60'),
+            'rate_limit_calls': _s(config.get('rate_limit_calls'), '40'),
+            'webhook_url': _s(config.get('webhook_url')),
+            'features_enabled': orjson.dumps(config.get('features_enabled', []), option=orjson.OPT_NON_STR_KEYS).decode(),
             'sync_enabled': str(config.get('sync_enabled', True)),
-            'last_sync': str(config.get('last_sync', '')),
-            'created_at': datetime.utcnow().isoformat() + 'Z',
-            'updated_at': datetime.utcnow().isoformat() + 'Z',
+            'last_sync': _s(config.get('last_sync')),
+            'created_at': now,
+            'updated_at': now,
         }
 
-        self.redis_client.hset(provider_key, mapping=provider_data)
-        self.redis_client.sadd(providers_set_key, provider)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(provider_key, mapping=provider_data)
+            pipe.sadd(providers_set_key, provider)
+            pipe.execute()
 
+        _providers_cache.pop(self._providers_cache_key(tenant_id), None)
         return True
 
     def get_provider(self, tenant_id: str, provider: str) -> Optional[Dict[str, Any]]:
@@ -77,15 +118,39 @@ class ProviderManager:
         if not data:
             return None
 
-        data['scopes'] = json.loads(data.get('scopes', '[]'))
-        data['features_enabled'] = json.loads(data.get('features_enabled', '[]'))
+        return self.parse_provider_data(data)
+
+    @staticmethod
+    def parse_provider_data(data: Dict[str, str]) -> Dict[str, Any]:
+        data['scopes'] = orjson.loads(data.get('scopes', '[]'))
+        data['features_enabled'] = orjson.loads(data.get('features_enabled', '[]'))
         data['sync_enabled'] = data.get('sync_enabled', 'True') == 'True'
 
         return data
 
     def get_all_providers(self, tenant_id: str) -> List[str]:
+        now = time.monotonic()
+        cache_key = self._providers_cache_key(tenant_id)
+        cached = _providers_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
+
         providers_set_key = self.get_providers_set_key(tenant_id)
-        return list(self.redis_client.smembers(providers_set_key))
+        providers = list(self.redis_client.smembers(providers_set_key))
+
+        if len(_providers_cache) >= _PROVIDERS_CACHE_MAX_TENANTS:
+            _providers_cache.clear()
+        _providers_cache[cache_key] = (now + _PROVIDERS_CACHE_TTL, tuple(providers))
+        return providers
+
+    def _providers_cache_key(self, tenant_id: str) -> tuple:
+        connection_kwargs = self.redis_client.connection_pool.connection_kwargs
+        return (
+            connection_kwargs.get('host'),
+            connection_kwargs.get('port'),
+            connection_kwargs.get('db'),
+            tenant_id,
+        )
 
     def update_provider(
         self,
@@ -95,30 +160,32 @@ class ProviderManager:
     ) -> bool:
         provider_key = self.get_provider_key(tenant_id, provider)
 
-        if not self.redis_client.exists(provider_key):
-            return False
-
         update_data = {}
         for key, value in updates.items():
-            if key in ['scopes', 'features_enabled']:
-                update_data[key] = json.dumps(value)
-            elif key == 'sync_enabled':
+            if key in _JSON_FIELDS:
+                update_data[key] = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+            elif key in _BOOL_FIELDS:
                 update_data[key] = str(value)
             else:
                 update_data[key] = value
 
         update_data['updated_at'] = datetime.utcnow().isoformat() + 'Z'
 
-        self.redis_client.hset(provider_key, mapping=update_data)
-        return True
+        # Existence check and write in one round trip
+        return bool(_HSET_IF_EXISTS(
+            keys=[provider_key], args=_flatten_mapping(update_data), client=self.redis_client
+        ))
 
     def delete_provider(self, tenant_id: str, provider: str) -> bool:
         provider_key = self.get_provider_key(tenant_id, provider)
         providers_set_key = self.get_providers_set_key(tenant_id)
 
-        self.redis_client.delete(provider_key)
-        self.redis_client.srem(providers_set_key, provider)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.delete(provider_key)
+            pipe.srem(providers_set_key, provider)
+            pipe.execute()
 
+        _providers_cache.pop(self._providers_cache_key(tenant_id), None)
         return True
 
     def update_tokens(
@@ -129,10 +196,8 @@ class ProviderManager:
         refresh_token: Optional[str] = None,
         expires_at: Optional[str] = None
     ) -> bool:
-        updates = {
-            'access_token': access_token,
-            'updated_at': datetime.utcnow().isoformat() + 'Z'
-        }
+        # update_provider stamps updated_at
+        updates = {'access_token': access_token}
 
         if refresh_token:
             updates['refresh_token'] = refresh_token
@@ -144,26 +209,33 @@ class ProviderManager:
 
     def get_active_providers(self, tenant_id: str) -> List[Dict[str, Any]]:
         providers = self.get_all_providers(tenant_id)
-        active_providers = []
+        if not providers:
+            return []
 
-        for provider in providers:
-            provider_data = self.get_provider(tenant_id, provider)
-            if provider_data and provider_data.get('status') == 'active':
-                active_providers.append(provider_data)
+        # Fetch every provider hash in one round trip
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for provider in providers:
+                pipe.hgetall(self.get_provider_key(tenant_id, provider))
+            results = pipe.execute()
 
-        return active_providers
+        return [
+            self.parse_provider_data(data)
+            for data in results
+            if data and data.get('status') == 'active'
+        ]
 
     def set_tenant_config(self, tenant_id: str, config: Dict[str, Any]) -> bool:
         tenant_key = f"{self.get_tenant_key(tenant_id)}:config"
+        now = datetime.utcnow().isoformat() + 'Z'
 
         tenant_data = {
             'name': config.get('name', tenant_id),
             'primary_provider': config.get('primary_provider', ''),
             'sync_strategy': config.get('sync_strategy', 'primary'),
-            'data_retention_days': str(config.get('data_retention_days', 30)),
+            'data_retention_days': _s(config.get('data_retention_days'), '30'),
             'timezone': config.get('timezone', 'UTC'),
-            'created_at': config.get('created_at', datetime.utcnow().isoformat() + 'Z'),
-            'updated_at': datetime.utcnow().isoformat() + 'Z',
+            'created_at': config.get('created_at', now),
+            'updated_at': now,
         }
 
         self.redis_client.hset(tenant_key, mapping=tenant_data)
@@ -187,19 +259,22 @@ class ProviderManager:
     ) -> bool:
         system_key = self.get_system_key(tenant_id, app)
         systems_set_key = self.get_systems_set_key(tenant_id)
+        now = datetime.utcnow().isoformat() + 'Z'
 
         system_data = {
-            'client_id': str(config.get('client_id', '')),
-            'client_secret': str(config.get('client_secret', '')),
-            'redirect_uri': str(config.get('redirect_uri', '')),
-            'auth_url': str(config.get('auth_url', '')),
-            'token_url': str(config.get('token_url', '')),
-            'created_at': datetime.utcnow().isoformat() + 'Z',
-            'updated_at': datetime.utcnow().isoformat() + 'Z',
+            'client_id': _s(config.get('client_id')),
+            'client_secret': _s(config.get('client_secret')),
+            'redirect_uri': _s(config.get('redirect_uri')),
+            'auth_url': _s(config.get('auth_url')),
+            'token_url': _s(config.get('token_url')),
+            'created_at': now,
+            'updated_at': now,
         }
 
-        self.redis_client.hset(system_key, mapping=system_data)
-        self.redis_client.sadd(systems_set_key, app)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(system_key, mapping=system_data)
+            pipe.sadd(systems_set_key, app)
+            pipe.execute()
 
         return True
 
@@ -224,27 +299,28 @@ class ProviderManager:
     ) -> bool:
         system_key = self.get_system_key(tenant_id, app)
 
-        if not self.redis_client.exists(system_key):
-            return False
-
         updates['updated_at'] = datetime.utcnow().isoformat() + 'Z'
 
-        self.redis_client.hset(system_key, mapping=updates)
-        return True
+        # Existence check and write in one round trip
+        return bool(_HSET_IF_EXISTS(
+            keys=[system_key], args=_flatten_mapping(updates), client=self.redis_client
+        ))
 
     def delete_system_credentials(self, tenant_id: str, app: str) -> bool:
         system_key = self.get_system_key(tenant_id, app)
         systems_set_key = self.get_systems_set_key(tenant_id)
 
-        self.redis_client.delete(system_key)
-        self.redis_client.srem(systems_set_key, app)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.delete(system_key)
+            pipe.srem(systems_set_key, app)
+            pipe.execute()
 
         return True
 
 
 def get_provider_manager():
     return ProviderManager(
-        redis_host=os.getenv('REDIS_HOST', 'localhost'),
+        redis_host=os.getenv('REDIS_HOST', DEFAULT_REDIS_HOST),
         redis_port=int(os.getenv('REDIS_PORT', 6379)),
         redis_db=int(os.getenv('REDIS_DB', 0))
     )
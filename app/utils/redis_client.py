@@ -1,21 +1,58 @@
 #!/usr/bin/env python3
 
 import redis
+import orjson
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
 
+__all__ = ['DEFAULT_REDIS_HOST', 'get_connection_pool', 'get_redis_client', 'get_session_data']
 
-def get_redis_client():
-    """Get Redis client connection."""
-    return redis.Redis(
-        host=os.getenv('REDIS_HOST', 'tesseract-redis'),
-        port=int(os.getenv('REDIS_PORT', 6379)),
-        db=int(os.getenv('REDIS_DB', 0)),
+# Single default for REDIS_HOST across the gateway (matches app.core.config.Settings)
+DEFAULT_REDIS_HOST = 'tesseract-redis'
+
+
+@lru_cache(maxsize=None)
+def get_connection_pool(host: str, port: int = 6379, db: int = 0) -> redis.BlockingConnectionPool:
+    """
+    Get the shared, bounded connection pool for a Redis server.
+
+    One pool exists per (host, port, db), so every client pointed at the same
+    server draws from the same sockets (pass the arguments positionally so the
+    cache key matches). Callers block for up to 5 seconds when
+    all REDIS_POOL_SIZE connections are busy instead of opening new ones.
+
+    Args:
+        host: Redis host
+        port: Redis port
+        db: Redis database number
+
+    Returns:
+        Connection pool with keepalive and periodic health checks enabled
+    """
+    return redis.BlockingConnectionPool(
+        host=host,
+        port=port,
+        db=db,
+        max_connections=int(os.getenv('REDIS_POOL_SIZE', 16)),
+        timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30,
         decode_responses=True
     )
 
+
+@lru_cache(maxsize=1)
+def get_redis_client():
+    """Get the shared Redis client (created once, so its connection pool is reused)."""
+    return redis.Redis(connection_pool=get_connection_pool(
+        os.getenv('REDIS_HOST', DEFAULT_REDIS_HOST),
+        int(os.getenv('REDIS_PORT', 6379)),
+        int(os.getenv('REDIS_DB', 0))
+    ))
+
 def get_session_data(session_id: str):
     """
     Get session data from Redis.
@@ -26,8 +63,6 @@ def get_session_data(session_id: str):
     Returns:
         Dictionary containing session data or None if not found
     """
-    import json
-    
     client = get_redis_client()
     session_key = f"session:{session_id}"
     
@@ -38,9 +73,9 @@ def get_session_data(session_id: str):
         
         # Parse JSON fields
         if "provider_tokens" in session_data:
-            session_data["provider_tokens"] = json.loads(session_data["provider_tokens"])
+            session_data["provider_tokens"] = orjson.loads(session_data["provider_tokens"])
         if "system_creds" in session_data:
-            session_data["system_creds"] = json.loads(session_data["system_creds"])
+            session_data["system_creds"] = orjson.loads(session_data["system_creds"])
         
         return session_data
     except Exception as e:
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
 import uuid
-import json
+import orjson
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from .provider_manager import ProviderManager
 
 
 class SessionManager:
@@ -22,21 +24,24 @@ class SessionManager:
         provider_tokens: Dict[str, Any]
     ) -> Dict[str, Any]:
         session_id = str(uuid.uuid4())
-        created_at = datetime.utcnow().isoformat() + 'Z'
-        expires_at = (datetime.utcnow() + timedelta(seconds=self.session_ttl)).isoformat() + 'Z'
+        now = datetime.utcnow()
+        created_at = now.isoformat() + 'Z'
+        expires_at = (now + timedelta(seconds=self.session_ttl)).isoformat() + 'Z'
 
         session_data = {
             'tenant': tenant,
             'app': app,
-            'system_creds': json.dumps(system_creds),
-            'provider_tokens': json.dumps(provider_tokens),
+            'system_creds': orjson.dumps(system_creds, option=orjson.OPT_NON_STR_KEYS).decode(),
+            'provider_tokens': orjson.dumps(provider_tokens, option=orjson.OPT_NON_STR_KEYS).decode(),
             'created_at': created_at,
             'expires_at': expires_at
         }
 
         session_key = self._get_session_key(session_id)
-        self.redis_client.hset(session_key, mapping=session_data)
-        self.redis_client.expire(session_key, self.session_ttl)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(session_key, mapping=session_data)
+            pipe.expire(session_key, self.session_ttl)
+            pipe.execute()
 
         return {
             'session_id': session_id,
@@ -54,11 +59,32 @@ class SessionManager:
         if not data:
             return None
 
-        data['system_creds'] = json.loads(data.get('system_creds', '{}'))
-        data['provider_tokens'] = json.loads(data.get('provider_tokens', '{}'))
+        return self._parse_session_data(data)
+
+    @staticmethod
+    def _parse_session_data(data: Dict[str, str]) -> Dict[str, Any]:
+        data['system_creds'] = orjson.loads(data.get('system_creds', '{}'))
+        data['provider_tokens'] = orjson.loads(data.get('provider_tokens', '{}'))
 
         return data
 
+    def get_session_and_provider(
+        self,
+        session_id: str,
+        tenant_id: str,
+        provider: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        # Session and provider hashes in one round trip (auth + dispatch fast path)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._get_session_key(session_id))
+            pipe.hgetall(ProviderManager.get_provider_key(tenant_id, provider))
+            session_data, provider_data = pipe.execute()
+
+        return (
+            self._parse_session_data(session_data) if session_data else None,
+            ProviderManager.parse_provider_data(provider_data) if provider_data else None,
+        )
+
     def validate_session(self, session_id: str) -> bool:
         session_key = self._get_session_key(session_id)
         return self.redis_client.exists(session_key) > 0
@@ -75,10 +101,8 @@ class SessionManager:
 
     def refresh_session_ttl(self, session_id: str) -> bool:
         session_key = self._get_session_key(session_id)
-        if not self.redis_client.exists(session_key):
-            return False
-        self.redis_client.expire(session_key, self.session_ttl)
-        return True
+        # EXPIRE returns 0 when the key does not exist, so no EXISTS check is needed
+        return bool(self.redis_client.expire(session_key, self.session_ttl))
 
 
 def get_session_manager(redis_client):
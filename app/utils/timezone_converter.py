@@ -7,6 +7,7 @@ between different timezone formats used across platforms.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -87,10 +88,44 @@ IANA_TO_RC_ID_MAPPING = {
 }
 
 
+# Every known timezone name (RingCentral and common names) in one table, so a
+# name resolves with a single probe whichever API it came through
+_TIMEZONE_LOOKUP = {**RC_TO_IANA_MAPPING, **COMMON_NAME_TO_IANA_MAPPING}
+
+# Every IANA name the tables above can produce; the common already-IANA input
+# is recognised with one set probe
+_KNOWN_IANA = frozenset(
+    set(RC_TO_IANA_MAPPING.values())
+    | set(RC_ID_TO_IANA_MAPPING.values())
+    | set(COMMON_NAME_TO_IANA_MAPPING.values())
+    | {'UTC'}
+)
+
+# Region prefixes of IANA names that are passed through unchanged; shared with
+# ZoomTransformerHelper so both converters accept the same names
+_IANA_REGION_PREFIXES = ('America/', 'Europe/', 'Asia/', 'Pacific/', 'Australia/')
+
+# Substring heuristics for unmapped US zone names, checked in order
+_FALLBACK_PATTERNS = (
+    ('pacific', 'America/Los_Angeles'),
+    ('mountain', 'America/Denver'),
+    ('central', 'America/Chicago'),
+    ('eastern', 'America/New_York'),
+)
+
+
+def _is_iana_name(timezone: str) -> bool:
+    """Return True for IANA names that are passed through unchanged."""
+    return timezone in _KNOWN_IANA or timezone.startswith(_IANA_REGION_PREFIXES)
+
+
+@lru_cache(maxsize=256)
 def convert_to_iana_timezone(rc_timezone: str) -> str:
     """
     Convert RingCentral timezone format to IANA timezone format.
     
+    Results are cached per input, so the conversion is logged once per distinct value.
+    
     Args:
         rc_timezone: RingCentral timezone string or existing IANA timezone
         
@@ -102,43 +137,21 @@ def convert_to_iana_timezone(rc_timezone: str) -> str:
         return 'America/Los_Angeles'
 
     # Check if it's already in IANA format (e.g., America/New_York)
-    if '/' in rc_timezone and (
-        rc_timezone.startswith('America/') or 
-        rc_timezone.startswith('Europe/') or 
-        rc_timezone.startswith('Asia/') or 
-        rc_timezone.startswith('Pacific/') or
-        rc_timezone == 'UTC'
-    ):
+    if _is_iana_name(rc_timezone):
         return rc_timezone
 
-    # Direct mapping lookup for RingCentral formats
-    if rc_timezone in RC_TO_IANA_MAPPING:
-        iana_timezone = RC_TO_IANA_MAPPING[rc_timezone]
+    # Direct mapping lookup for RingCentral formats and common names
+    iana_timezone = _TIMEZONE_LOOKUP.get(rc_timezone)
+    if iana_timezone is not None:
         logger.info(f"Converted timezone: {rc_timezone} → {iana_timezone}")
         return iana_timezone
     
-    # Fallback: try to parse common patterns
-    rc_lower = rc_timezone.lower().strip()
-    
-    # Check for Pacific variations
-    if 'pacific' in rc_lower:
-        logger.info(f"Pacific timezone detected: {rc_timezone} → America/Los_Angeles")
-        return 'America/Los_Angeles'
-    
-    # Check for Mountain variations
-    elif 'mountain' in rc_lower:
-        logger.info(f"Mountain timezone detected: {rc_timezone} → America/Denver")
-        return 'America/Denver'
-    
-    # Check for Central variations  
-    elif 'central' in rc_lower:
-        logger.info(f"Central timezone detected: {rc_timezone} → America/Chicago")
-        return 'America/Chicago'
-    
-    # Check for Eastern variations
-    elif 'eastern' in rc_lower:
-        logger.info(f"Eastern timezone detected: {rc_timezone} → America/New_York")
-        return 'America/New_York'
+    # Fallback: try to parse common patterns (first match wins)
+    rc_lower = rc_timezone.lower()
+    for needle, iana_timezone in _FALLBACK_PATTERNS:
+        if needle in rc_lower:
+            logger.info(f"{needle.capitalize()} timezone detected: {rc_timezone} → {iana_timezone}")
+            return iana_timezone
     
     # Default fallback
     logger.warning(f"Unknown timezone format: {rc_timezone}, defaulting to America/Los_Angeles")
@@ -161,20 +174,22 @@ def transform_timezone_to_iana(timezone_data: Dict[str, Any]) -> Optional[str]:
         return None
         
     try:
+        # Handle direct string timezone values: known name, else pass IANA names through
+        if isinstance(timezone_data, str):
+            return _TIMEZONE_LOOKUP.get(
+                timezone_data,
+                timezone_data if _is_iana_name(timezone_data) else None
+            )
+        
         # Handle RingCentral timezone format to IANA conversion
         if isinstance(timezone_data, dict):
             if 'id' in timezone_data:
                 # Map RingCentral timezone IDs to IANA format
                 return RC_ID_TO_IANA_MAPPING.get(str(timezone_data['id']))
-                
-            if 'name' in timezone_data:
-                # Handle timezone name to IANA conversion
-                return COMMON_NAME_TO_IANA_MAPPING.get(timezone_data['name'])
-        
-        elif isinstance(timezone_data, str):
-            # Handle direct string timezone values
-            return timezone_data if timezone_data.startswith('America/') or timezone_data.startswith('Pacific/') else None
             
+            # Handle timezone name to IANA conversion
+            return _TIMEZONE_LOOKUP.get(timezone_data.get('name'))
+        
         return None
         
     except Exception as e:
@@ -213,12 +228,25 @@ def convert_timezone_to_ringcentral_id(timezone_str: str) -> str:
     """
     Convert IANA timezone string to RingCentral numeric timezone ID.
     
+    Results are cached per input, so the fallback is logged once per distinct value.
+    
     Args:
         timezone_str: IANA timezone string to convert
         
     Returns:
         RingCentral timezone ID string
     """
+    try:
+        return _timezone_to_ringcentral_id(timezone_str)
+    except TypeError as e:
+        # Unhashable input: it cannot be cached or matched
+        logger.error(f"Error converting timezone {timezone_str} to RingCentral ID: {str(e)}")
+        return '58'  # Default fallback
+
+
+@lru_cache(maxsize=256)
+def _timezone_to_ringcentral_id(timezone_str: str) -> str:
+    # Body of convert_timezone_to_ringcentral_id for hashable inputs, memoized per input
     try:
         # Try exact match first
         if timezone_str in IANA_TO_RC_ID_MAPPING:
@@ -7,11 +7,86 @@ and sanitizing data across different platform transformations.
 """
 
 import logging
-import re
-from typing import Dict, List, Any, Optional, Union, Callable
+from collections import namedtuple
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 
 logger = logging.getLogger(__name__)
 
+# RingCentral user type to Zoom user type (1=User, 2=DigitalUser, 99=Other)
+_USER_TYPE_MAPPING = {
+    'User': 1,
+    'DigitalUser': 2,
+    'FlexibleUser': 1,  # Map to regular user
+    'FaxUser': 99,
+    'VirtualUser': 99,
+    'Department': 99,
+    'Announcement': 99,
+    'Voicemail': 99,
+    'SharedLinesGroup': 99,
+    'PagingOnly': 99,
+    'IvrMenu': 99,
+    'ApplicationExtension': 99,
+    'ParkLocation': 99,
+    'Limited': 99,
+    'Bot': 99,
+    'ProxyAdmin': 99,
+    'DelegatedLinesGroup': 99,
+    'Site': 99
+}
+
+# Compiled validation rules: ([(field, transform)], [(field, max_length, truncate)])
+ValidationPlan = Tuple[List[Tuple[str, Callable[[Any], Any]]], List[Tuple[str, int, bool]]]
+
+# A plan fused per field: ((field, transform or None, max_length or None, truncate), ...)
+_FusedOps = Tuple[Tuple[str, Optional[Callable[[Any], Any]], Optional[int], bool], ...]
+
+# minimum_length rule settings with legacy names and defaults already resolved
+_MinLengthConfig = namedtuple('_MinLengthConfig', 'min_length pad_with pad_direction')
+
+# Sentinel for dict lookups where None is a legitimate value
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _split_path(field_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path into its parts (cached per path)."""
+    return tuple(field_path.split('.'))
+
+
+@lru_cache(maxsize=4096)
+def _parse_path(field_path: str) -> Tuple[Tuple[str, str, Optional[int]], ...]:
+    """
+    Parse a dot-notation path with array support into (kind, key, index) tokens.
+    
+    kind is 'plain' for 'key', 'wildcard' for 'key[*]' and 'index' for
+    'key[N]'; index is None unless kind is 'index' and N is an integer.
+    Results are cached per path.
+    
+    Args:
+        field_path: Dot notation path with array support
+        
+    Returns:
+        Tuple of (kind, key, index) tokens
+    """
+    tokens = []
+    for part in _split_path(field_path):
+        # Check if this part contains array notation
+        if '[' in part and ']' in part:
+            open_pos = part.index('[')
+            key_part = part[:open_pos]
+            index_part = part[open_pos + 1:part.index(']')]
+            if index_part == '*':
+                tokens.append(('wildcard', key_part, None))
+            else:
+                try:
+                    tokens.append(('index', key_part, int(index_part)))
+                except ValueError:
+                    tokens.append(('index', key_part, None))
+        else:
+            tokens.append(('plain', part, None))
+    return tuple(tokens)
+
 
 def extract_nested_field(record: Dict[str, Any], field_path: str) -> Any:
     """
@@ -24,26 +99,25 @@ def extract_nested_field(record: Dict[str, Any], field_path: str) -> Any:
     Returns:
         Extracted field value or None if not found
     """
-    logger.debug(f"EXTRACT_NESTED: Extracting '{field_path}' from record")
+    logger.debug("EXTRACT_NESTED: Extracting '%s' from record", field_path)
     
     if not field_path:
-        logger.warning(f"EXTRACT_NESTED: Empty field path provided")
+        logger.warning("EXTRACT_NESTED: Empty field path provided")
         return None
     
-    # Split the path by dots
-    path_parts = field_path.split('.')
     current_value = record
     
     try:
-        for part in path_parts:
-            if isinstance(current_value, dict) and part in current_value:
+        # Split the path by dots
+        for part in _split_path(field_path):
+            if (type(current_value) is dict or isinstance(current_value, dict)) and part in current_value:
                 current_value = current_value[part]
-                logger.debug(f"EXTRACT_NESTED: Found '{part}' = {current_value}")
+                logger.debug("EXTRACT_NESTED: Found '%s' = %s", part, current_value)
             else:
-                logger.warning(f"EXTRACT_NESTED: Could not find '{part}' in {type(current_value)} {current_value}")
+                logger.warning("EXTRACT_NESTED: Could not find '%s' in %s %s", part, type(current_value), current_value)
                 return None
         
-        logger.info(f"EXTRACT_NESTED: Successfully extracted '{field_path}' = {current_value}")
+        logger.info("EXTRACT_NESTED: Successfully extracted '%s' = %s", field_path, current_value)
         return current_value
         
     except Exception as e:
@@ -51,6 +125,84 @@ def extract_nested_field(record: Dict[str, Any], field_path: str) -> Any:
         return None
 
 
+def _walk_plain_path(value: Any, parts: Tuple[str, ...]) -> Any:
+    """Walk a plain dot path (no array notation); None if any step is missing."""
+    # Records are JSON-derived, so the exact-type check almost always decides;
+    # isinstance() only runs for dict subclasses and non-dicts
+    for part in parts:
+        if type(value) is not dict and not isinstance(value, dict):
+            return None
+        value = value.get(part, _MISSING)
+        if value is _MISSING:
+            return None
+    return value
+
+
+def _walk_parsed_path(value: Any, tokens: Tuple[Tuple[str, str, Optional[int]], ...]) -> Any:
+    """Walk _parse_path tokens with array index/wildcard support; None if any step fails."""
+    for kind, key, index in tokens:
+        if kind == 'plain':
+            # Regular field navigation
+            if (type(value) is dict or isinstance(value, dict)) and key in value:
+                value = value[key]
+                logger.debug("Navigated to '%s', current value: %s", key, value)
+            else:
+                logger.debug("Cannot traverse '%s' - current value is not a dict: %s", key, type(value))
+                return None
+            continue
+        
+        # Navigate to the array
+        if not ((type(value) is dict or isinstance(value, dict)) and key in value):
+            logger.debug("Cannot traverse '%s' - current value is not a dict or key not found", key)
+            return None
+        
+        array_value = value[key]
+        logger.debug("Navigated to array '%s', current value: %s", key, array_value)
+        
+        if not isinstance(array_value, list):
+            logger.debug("Field '%s' is not an array: %s", key, type(array_value))
+            return None
+        
+        if kind == 'wildcard':
+            # Return the entire array for wildcard
+            value = array_value
+            logger.debug("Returning entire array for wildcard: %s items", len(array_value))
+        elif index is None:
+            logger.debug("Invalid array index for '%s' - not an integer", key)
+            return None
+        elif 0 <= index < len(array_value):
+            value = array_value[index]
+            logger.debug("Navigated to array index [%s], current value: %s", index, value)
+        else:
+            logger.debug("Array index [%s] out of bounds for array of length %s", index, len(array_value))
+            return None
+    
+    logger.debug("Successfully resolved nested field path to value: %s", value)
+    return value
+
+
+def _path_walker(field_path: str) -> Tuple[Callable[[Any, Any], Any], Any]:
+    """Pick the walker for a path and its cached parse; plain dot paths need no array parsing."""
+    if '[' not in field_path:
+        return _walk_plain_path, _split_path(field_path)
+    return _walk_parsed_path, _parse_path(field_path)
+
+
+def _resolve_field(record: Any, field_path: str, walk: Callable[[Any, Any], Any], parsed: Any) -> Any:
+    """get_nested_field for an already-parsed path."""
+    try:
+        # First, check if the field_path exists as a literal key (for fields like 'zoomMapping.action')
+        if field_path in record:
+            logger.debug("Found literal field '%s' with value: %s", field_path, record[field_path])
+            return record[field_path]
+        
+        # If not found as literal, try nested navigation
+        return walk(record, parsed)
+    except Exception as e:
+        logger.error(f"Error resolving field path '{field_path}': {str(e)}")
+        return None
+
+
 def get_nested_field(record: Dict[str, Any], field_path: str) -> Any:
     """
     Get a nested field value using dot notation with array support.
@@ -63,62 +215,13 @@ def get_nested_field(record: Dict[str, Any], field_path: str) -> Any:
         Field value or None if not found
     """
     try:
-        # First, check if the field_path exists as a literal key (for fields like 'zoomMapping.action')
+        # Literal keys (the common case) resolve before any path parsing
         if field_path in record:
-            logger.debug(f"Found literal field '{field_path}' with value: {record[field_path]}")
+            logger.debug("Found literal field '%s' with value: %s", field_path, record[field_path])
             return record[field_path]
         
-        # If not found as literal, try nested navigation with array support
-        value = record
-        path_parts = field_path.split('.')
-        
-        for part in path_parts:
-            # Check if this part contains array notation
-            if '[' in part and ']' in part:
-                # Extract the key and array index/wildcard
-                key_part = part[:part.index('[')]
-                index_part = part[part.index('[') + 1:part.index(']')]
-                
-                # Navigate to the array
-                if isinstance(value, dict) and key_part in value:
-                    array_value = value[key_part]
-                    logger.debug(f"Navigated to array '{key_part}', current value: {array_value}")
-                    
-                    if isinstance(array_value, list):
-                        if index_part == '*':
-                            # Return the entire array for wildcard
-                            value = array_value
-                            logger.debug(f"Returning entire array for wildcard: {len(array_value)} items")
-                        else:
-                            # Try to get specific index
-                            try:
-                                index = int(index_part)
-                                if 0 <= index < len(array_value):
-                                    value = array_value[index]
-                                    logger.debug(f"Navigated to array index [{index}], current value: {value}")
-                                else:
-                                    logger.debug(f"Array index [{index}] out of bounds for array of length {len(array_value)}")
-                                    return None
-                            except ValueError:
-                                logger.debug(f"Invalid array index '{index_part}' - not an integer")
-                                return None
-                    else:
-                        logger.debug(f"Field '{key_part}' is not an array: {type(array_value)}")
-                        return None
-                else:
-                    logger.debug(f"Cannot traverse '{key_part}' - current value is not a dict or key not found")
-                    return None
-            else:
-                # Regular field navigation
-                if isinstance(value, dict) and part in value:
-                    value = value[part]
-                    logger.debug(f"Navigated to '{part}', current value: {value}")
-                else:
-                    logger.debug(f"Cannot traverse '{part}' - current value is not a dict: {type(value)}")
-                    return None
-        
-        logger.debug(f"Successfully resolved nested field path '{field_path}' to value: {value}")
-        return value
+        walk, parsed = _path_walker(field_path)
+        return walk(record, parsed)
     except Exception as e:
         logger.error(f"Error resolving field path '{field_path}': {str(e)}")
         return None
@@ -150,21 +253,21 @@ def get_nested_field_with_multi_lookup(record: Dict[str, Any], field_path: str)
             array_value = get_nested_field(record, base_path)
             
             if isinstance(array_value, list):
-                results = []
-                for item in array_value:
-                    if remaining_path:
-                        # Navigate further into each array item
-                        item_value = get_nested_field(item, remaining_path)
-                        # CRITICAL: Always append to preserve array indices, even for null values
-                        results.append(item_value)
-                    else:
-                        # Return the item itself if no remaining path
-                        results.append(item)
+                if remaining_path:
+                    # Navigate further into each array item, parsing the path once.
+                    # CRITICAL: Always append to preserve array indices, even for null values
+                    walk, parsed = _path_walker(remaining_path)
+                    results = [
+                        _resolve_field(item, remaining_path, walk, parsed) for item in array_value
+                    ]
+                else:
+                    # Return the items themselves if no remaining path
+                    results = list(array_value)
                 
-                logger.debug(f"Multi-lookup for '{field_path}' returned {len(results)} results")
+                logger.debug("Multi-lookup for '%s' returned %s results", field_path, len(results))
                 return results
             else:
-                logger.debug(f"Base path '{base_path}' is not an array: {type(array_value)}")
+                logger.debug("Base path '%s' is not an array: %s", base_path, type(array_value))
                 return []
         else:
             # Regular single field lookup
@@ -186,14 +289,12 @@ def set_nested_value(record: Dict[str, Any], field_path: str, value: Any) -> Non
         value: Value to set
     """
     try:
-        keys = field_path.split('.')
+        keys = _split_path(field_path)
         current = record
         
         # Navigate to the parent of the target field
         for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
+            current = current.setdefault(key, {})
         
         # Set the target field
         current[keys[-1]] = value
@@ -216,20 +317,32 @@ def apply_minimum_length_transformation(value: Any, config: Dict[str, Any]) -> s
     if value is None:
         return value
     
-    str_value = str(value)
-    
+    return _pad_to_min_length(_resolve_min_length_config(config), value)
+
+
+def _resolve_min_length_config(config: Dict[str, Any]) -> _MinLengthConfig:
     # Support both new and legacy field names
-    min_length = config.get('min_length', config.get('minimum_length', 3))
-    pad_with = config.get('padding_char', config.get('pad_with', '0'))
-    pad_direction = config.get('padding_direction', config.get('pad_direction', 'left'))
+    return _MinLengthConfig(
+        config.get('min_length', config.get('minimum_length', 3)),
+        config.get('padding_char', config.get('pad_with', '0')),
+        config.get('padding_direction', config.get('pad_direction', 'left'))
+    )
+
+
+def _pad_to_min_length(resolved: _MinLengthConfig, value: Any) -> str:
+    if value is None:
+        return value
+    
+    str_value = str(value)
+    min_length = resolved.min_length
     
     if len(str_value) >= min_length:
         return str_value
     
-    if pad_direction == 'right':
-        return str_value.ljust(min_length, pad_with)
+    if resolved.pad_direction == 'right':
+        return str_value.ljust(min_length, resolved.pad_with)
     else:  # left padding (default)
-        return str_value.rjust(min_length, pad_with)
+        return str_value.rjust(min_length, resolved.pad_with)
 
 
 def apply_custom_extension_format(value: Any, config: Dict[str, Any]) -> str:
@@ -243,38 +356,44 @@ def apply_custom_extension_format(value: Any, config: Dict[str, Any]) -> str:
     Returns:
         Formatted extension string
     """
-    logger.debug(f"EXTENSION_DEBUG: Input value='{value}' (type: {type(value)}), config={config}")
+    logger.debug("EXTENSION_DEBUG: Input value='%s' (type: %s), config=%s", value, type(value), config)
     
     if value is None:
-        logger.debug(f"EXTENSION_DEBUG: Value is None, returning as-is")
+        logger.debug("EXTENSION_DEBUG: Value is None, returning as-is")
         return value
     
-    str_value = str(value).strip()
-    prefix = config.get('prefix', '10')
-    min_length = config.get('min_length', 3)
-    
-    logger.debug(f"EXTENSION_DEBUG: str_value='{str_value}', prefix='{prefix}', min_length={min_length}")
-    
-    # If already long enough, return as-is
-    if len(str_value) >= min_length:
-        logger.debug(f"EXTENSION_DEBUG: Value '{str_value}' already meets min_length {min_length}, returning as-is")
+    return _make_extension_formatter(config.get('prefix', '10'), config.get('min_length', 3))(value)
+
+
+@lru_cache(maxsize=64)
+def _make_extension_formatter(prefix: str, min_length: int) -> Callable[[Any], str]:
+    """Build the custom_extension_format transform for one (prefix, min_length) config (cached)."""
+    def format_extension(value: Any) -> str:
+        str_value = str(value).strip()
+        length = len(str_value)
+        
+        # If already long enough, return as-is
+        if length >= min_length:
+            return str_value
+        
+        if str_value.isdigit():
+            # For single digits, prepend prefix (e.g., 2 -> 102, 3 -> 103)
+            if length == 1:
+                result = prefix + str_value
+                logger.info("EXTENSION_DEBUG: Single digit transformation: '%s' → '%s' (prefix: '%s')", str_value, result, prefix)
+                return result
+            
+            # For two digits, just prepend one digit from prefix
+            if length == 2:
+                result = prefix[0] + str_value
+                logger.info("EXTENSION_DEBUG: Two digit transformation: '%s' → '%s' (prefix[0]: '%s')", str_value, result, prefix[0])
+                return result
+        
+        # Fallback: just return the original value
+        logger.warning("EXTENSION_DEBUG: Could not transform '%s' (len=%s, isdigit=%s), returning as-is", str_value, length, str_value.isdigit())
         return str_value
     
-    # For single digits, prepend prefix (e.g., 2 -> 102, 3 -> 103)
-    if len(str_value) == 1 and str_value.isdigit():
-        result = prefix + str_value
-        logger.info(f"EXTENSION_DEBUG: Single digit transformation: '{str_value}' → '{result}' (prefix: '{prefix}')")
-        return result
-    
-    # For two digits, just prepend one digit from prefix
-    elif len(str_value) == 2 and str_value.isdigit():
-        result = prefix[0] + str_value
-        logger.info(f"EXTENSION_DEBUG: Two digit transformation: '{str_value}' → '{result}' (prefix[0]: '{prefix[0]}')")
-        return result
-    
-    # Fallback: just return the original value
-    logger.warning(f"EXTENSION_DEBUG: Could not transform '{str_value}' (len={len(str_value)}, isdigit={str_value.isdigit()}), returning as-is")
-    return str_value
+    return format_extension
 
 
 def validate_ar_name_length(ar_name: str, max_length: int = 30) -> Dict[str, Any]:
@@ -326,32 +445,11 @@ def map_user_type_to_zoom(rc_user_type: str) -> int:
     Returns:
         Zoom user type integer (1=User, 2=DigitalUser, 99=Other)
     """
-    user_type_mapping = {
-        'User': 1,
-        'DigitalUser': 2,
-        'FlexibleUser': 1,  # Map to regular user
-        'FaxUser': 99,
-        'VirtualUser': 99,
-        'Department': 99,
-        'Announcement': 99,
-        'Voicemail': 99,
-        'SharedLinesGroup': 99,
-        'PagingOnly': 99,
-        'IvrMenu': 99,
-        'ApplicationExtension': 99,
-        'ParkLocation': 99,
-        'Limited': 99,
-        'Bot': 99,
-        'ProxyAdmin': 99,
-        'DelegatedLinesGroup': 99,
-        'Site': 99
-    }
-
-    zoom_type = user_type_mapping.get(rc_user_type, 99)
+    zoom_type = _USER_TYPE_MAPPING.get(rc_user_type, 99)
     if zoom_type == 99 and rc_user_type:
-        logger.warning(f"Unknown RingCentral user type '{rc_user_type}', mapping to 99 (Other)")
+        logger.warning("Unknown RingCentral user type '%s', mapping to 99 (Other)", rc_user_type)
     else:
-        logger.info(f"Mapped RingCentral user type '{rc_user_type}' → Zoom type {zoom_type}")
+        logger.info("Mapped RingCentral user type '%s' → Zoom type %s", rc_user_type, zoom_type)
 
     return zoom_type
 
@@ -367,17 +465,155 @@ def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -
     Returns:
         Validation result with status and missing fields
     """
-    validation_result = {
-        'valid': True,
-        'missing_fields': []
+    # Absent keys read as None, so one get per field covers missing, None and ''
+    get = data.get
+    missing_fields = [field for field in required_fields if get(field) in (None, '')]
+    
+    return {
+        'valid': not missing_fields,
+        'missing_fields': missing_fields
     }
+
+
+def compile_validation_plan(rules: Dict[str, Any]) -> ValidationPlan:
+    """
+    Compile validation rules into a plan that can be applied to many records.
     
-    for field in required_fields:
-        if field not in data or data[field] is None or data[field] == '':
-            validation_result['valid'] = False
-            validation_result['missing_fields'].append(field)
+    Rule types are dispatched once here instead of per record; unknown
+    transformation and validation types are dropped, as they were no-ops.
     
-    return validation_result
+    Args:
+        rules: Validation and transformation rules
+        
+    Returns:
+        Tuple of (transform_ops, validation_ops): transform_ops are
+        (field, transform) pairs, validation_ops are (field, max_length, truncate)
+    """
+    transform_ops = []
+    for field, transform_rule in rules.get('transformations', {}).items():
+        transform_type = transform_rule.get('type')
+        
+        if transform_type == 'minimum_length':
+            transform_ops.append((field, partial(_pad_to_min_length, _resolve_min_length_config(transform_rule))))
+        
+        elif transform_type == 'custom_extension_format':
+            formatter = _make_extension_formatter(
+                transform_rule.get('prefix', '10'), transform_rule.get('min_length', 3)
+            )
+            transform_ops.append((field, partial(_format_extension_or_none, formatter)))
+    
+    validation_ops = []
+    for field, validation_rule in rules.get('validations', {}).items():
+        if validation_rule.get('type') == 'max_length':
+            validation_ops.append((
+                field,
+                validation_rule.get('max_length', 255),
+                validation_rule.get('truncate', False)
+            ))
+    
+    return transform_ops, validation_ops
+
+
+def _format_extension_or_none(formatter: Callable[[Any], str], value: Any) -> Optional[str]:
+    return value if value is None else formatter(value)
+
+
+def _fuse_plan(plan: ValidationPlan) -> _FusedOps:
+    """
+    Merge a plan's transforms and checks into one (field, transform, max_length, truncate) op per field.
+    
+    Transform-only fields come first, then checked fields in validation
+    order, so validation_results keep their original key order.
+    """
+    transform_ops, validation_ops = plan
+    transforms = dict(transform_ops)
+    checked_fields = {field for field, _, _ in validation_ops}
+    
+    ops = [
+        (field, transform, None, False)
+        for field, transform in transform_ops
+        if field not in checked_fields
+    ]
+    ops.extend(
+        (field, transforms.get(field), max_length, truncate)
+        for field, max_length, truncate in validation_ops
+    )
+    return tuple(ops)
+
+
+def _apply_fused_ops(data: Dict[str, Any], ops: _FusedOps) -> Dict[str, Any]:
+    # Copied on first write only; untouched records are returned as-is
+    result = data
+    copied = False
+    validation_results = {}
+    
+    # Each targeted field is read once, transformed, then checked
+    for field, transform, max_length, truncate in ops:
+        if field not in result:
+            continue
+        value = result[field]
+        
+        if transform is not None:
+            value = transform(value)
+            if not copied:
+                result = data.copy()
+                copied = True
+            result[field] = value
+        
+        if max_length is None:
+            continue
+        
+        if not isinstance(value, str):
+            value = str(value)
+        length = len(value)
+        
+        if length > max_length:
+            # Truncate if configured to do so
+            if truncate:
+                if not copied:
+                    result = data.copy()
+                    copied = True
+                result[field] = value[:max_length]
+                validation_results[field] = {
+                    'valid': True,
+                    'truncated': True,
+                    'original_length': length,
+                    'truncated_to': max_length
+                }
+            else:
+                validation_results[field] = {
+                    'valid': False,
+                    'reason': f'Value exceeds maximum length of {max_length} characters',
+                    'length': length,
+                    'max_length': max_length
+                }
+    
+    return {
+        'data': result,
+        'validation_results': validation_results
+    }
+
+
+def compile_ruleset(rules: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Compile validation rules into a single-pass validator for whole records.
+    
+    Transformations and validations are fused per field, so each targeted
+    field is looked up once per record.
+    
+    Args:
+        rules: Validation and transformation rules
+        
+    Returns:
+        Callable taking a data dictionary and returning a result shaped
+        like apply_validation_transformation()
+    """
+    ops = _fuse_plan(compile_validation_plan(rules))
+    
+    def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+        return _apply_fused_ops(data, ops)
+    
+    return validate
 
 
 def apply_validation_transformation(data: Dict[str, Any], 
@@ -385,6 +621,9 @@ def apply_validation_transformation(data: Dict[str, Any],
     """
     Apply a set of validation rules to a data dictionary.
     
+    Rules are dispatched directly for this one record; use compile_ruleset()
+    or compile_validation_plan() to reuse the same rules across many records.
+    
     Args:
         data: Dictionary to validate and transform
         rules: Validation and transformation rules
@@ -395,8 +634,7 @@ def apply_validation_transformation(data: Dict[str, Any],
     result = data.copy()
     
     # Apply transformations
-    transformations = rules.get('transformations', {})
-    for field, transform_rule in transformations.items():
+    for field, transform_rule in rules.get('transformations', {}).items():
         if field in result:
             transform_type = transform_rule.get('type')
             
@@ -407,34 +645,33 @@ def apply_validation_transformation(data: Dict[str, Any],
                 result[field] = apply_custom_extension_format(result[field], transform_rule)
     
     # Apply validations
-    validations = rules.get('validations', {})
     validation_results = {}
     
-    for field, validation_rule in validations.items():
-        if field in result:
-            validation_type = validation_rule.get('type')
+    for field, validation_rule in rules.get('validations', {}).items():
+        if field in result and validation_rule.get('type') == 'max_length':
+            max_length = validation_rule.get('max_length', 255)
+            value = result[field]
+            if not isinstance(value, str):
+                value = str(value)
+            length = len(value)
             
-            if validation_type == 'max_length':
-                max_length = validation_rule.get('max_length', 255)
-                value = str(result[field])
-                
-                if len(value) > max_length:
-                    # Truncate if configured to do so
-                    if validation_rule.get('truncate', False):
-                        result[field] = value[:max_length]
-                        validation_results[field] = {
-                            'valid': True,
-                            'truncated': True,
-                            'original_length': len(value),
-                            'truncated_to': max_length
-                        }
-                    else:
-                        validation_results[field] = {
-                            'valid': False,
-                            'reason': f'Value exceeds maximum length of {max_length} characters',
-                            'length': len(value),
-                            'max_length': max_length
-                        }
+            if length > max_length:
+                # Truncate if configured to do so
+                if validation_rule.get('truncate', False):
+                    result[field] = value[:max_length]
+                    validation_results[field] = {
+                        'valid': True,
+                        'truncated': True,
+                        'original_length': length,
+                        'truncated_to': max_length
+                    }
+                else:
+                    validation_results[field] = {
+                        'valid': False,
+                        'reason': f'Value exceeds maximum length of {max_length} characters',
+                        'length': length,
+                        'max_length': max_length
+                    }
     
     return {
         'data': result,
@@ -442,6 +679,57 @@ def apply_validation_transformation(data: Dict[str, Any],
     }
 
 
+def apply_validation_transformation_batch(rows: List[Dict[str, Any]],
+                                          plan: ValidationPlan) -> List[Dict[str, Any]]:
+    """
+    Apply a compiled validation plan to a batch of data dictionaries.
+    
+    Args:
+        rows: Dictionaries to validate and transform
+        plan: Plan from compile_validation_plan()
+        
+    Returns:
+        List of results shaped like apply_validation_transformation(), in input order
+    """
+    ops = _fuse_plan(plan)
+    return [_apply_fused_ops(row, ops) for row in rows]
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a template into literal chunks and the {field_path} placeholders between them (cached).
+    
+    Returns (literals, field_paths) with len(literals) == len(field_paths) + 1.
+    '{}' is not a placeholder, and placeholders padded with whitespace
+    (e.g. '{ id }') never matched the stripped replacement target, so both
+    stay in the literal text.
+    """
+    literals = []
+    field_paths = []
+    start = pos = 0
+    find = template.find
+    while True:
+        open_pos = find('{', pos)
+        if open_pos < 0:
+            break
+        close_pos = find('}', open_pos + 1)
+        if close_pos < 0:
+            break
+        field_path = template[open_pos + 1:close_pos]
+        if not field_path:
+            pos = open_pos + 1
+            continue
+        if field_path != field_path.strip():
+            pos = close_pos + 1
+            continue
+        literals.append(template[start:open_pos])
+        field_paths.append(field_path)
+        start = pos = close_pos + 1
+    literals.append(template[start:])
+    return tuple(literals), tuple(field_paths)
+
+
 def replace_template_placeholders(template: str, record: Dict[str, Any]) -> str:
     """
     Replace template placeholders with values from record.
@@ -454,23 +742,16 @@ def replace_template_placeholders(template: str, record: Dict[str, Any]) -> str:
         String with placeholders replaced
     """
     try:
-        result = template
-
-        # Find and replace all {field_path} placeholders (single braces)
-        import re
-        pattern = r'\{([^}]+)\}'
-        matches = re.findall(pattern, template)
+        literals, field_paths = _compile_template(template)
 
-        for field_path in matches:
-            field_path = field_path.strip()
+        # Fill each {field_path} placeholder; missing values become ''
+        parts = [literals[0]]
+        for field_path, literal in zip(field_paths, literals[1:]):
             value = get_nested_field(record, field_path)
+            parts.append('' if value is None else str(value))
+            parts.append(literal)
 
-            if value is not None:
-                result = result.replace(f"{{{field_path}}}", str(value))
-            else:
-                result = result.replace(f"{{{field_path}}}", "")
-
-        return result
+        return ''.join(parts)
 
     except Exception as e:
         logger.error(f"Error replacing template placeholders: {str(e)}")
@@ -6,11 +6,235 @@ It contains all platform-specific transformation logic for backward compatibilit
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime
 
+from .timezone_converter import (
+    COMMON_NAME_TO_IANA_MAPPING,
+    RC_ID_TO_IANA_MAPPING,
+    RC_TO_IANA_MAPPING as _RC_TO_IANA_MAPPING,
+    _FALLBACK_PATTERNS,
+    _is_iana_name,
+)
+from .validation import (
+    _path_walker,
+    _resolve_field,
+    _split_path,
+    get_nested_field as _get_nested_field,
+)
+
 logger = logging.getLogger(__name__)
 
+# Weekday name to number mapping (Zoom API format) - from ZoomBusinessHoursHelper
+_WEEKDAY_MAPPING = {
+    'sunday': 1,
+    'monday': 2,
+    'tuesday': 3,
+    'wednesday': 4,
+    'thursday': 5,
+    'friday': 6,
+    'saturday': 7
+}
+
+# IVR-related constants - from ZoomIVRHelper
+_ACTIONS_WITHOUT_TARGET = frozenset({-1, 21, 22, 23})  # Disabled, Repeat, Return to root, Return to previous
+
+# Extension type to Zoom IVR target type (anything else falls back to 'user')
+_ZOOM_TARGET_TYPES = {
+    'user': 'user',
+    'call_queue': 'call_queue',
+    'auto_receptionist': 'auto_receptionist'
+}
+
+# Country name to ISO 3166-1 alpha-2 code - from PayloadProcessorService
+_COUNTRY_TO_ISO = {
+    'United States': 'US',
+    'United States of America': 'US',
+    'USA': 'US',
+    'US': 'US',
+    'Canada': 'CA',
+    'United Kingdom': 'GB',
+    'Great Britain': 'GB',
+    'UK': 'GB',
+    'Australia': 'AU',
+    'Germany': 'DE',
+    'France': 'FR',
+    'Japan': 'JP',
+    'China': 'CN',
+    'India': 'IN',
+    'Brazil': 'BR',
+    'Mexico': 'MX'
+}
+
+# Input key mappings from RingCentral to Zoom
+_INPUT_KEY_MAPPINGS = {
+    'Star': '*',
+    'Hash': '#',
+    'NoInput': 'timeout',
+    # Numbers stay the same: '1' -> '1', '2' -> '2', etc.
+}
+
+# RingCentral IVR action to Zoom action code, keyed by (rc_action, target_type).
+# Universal actions (same for all target types) are keyed with target_type None.
+_ACTION_CODES = {
+    # user
+    ('Connect', 'user'): 2,                     # Forward to user
+    ('Voicemail', 'user'): 200,                 # Leave voicemail to user
+    ('Transfer', 'user'): 10,                   # Forward to phone number
+    ('ConnectToOperator', 'user'): 2,           # Forward to user (operator)
+    ('DialByName', 'user'): 4,                  # Forward to common area (closest match)
+    # call_queue
+    ('Connect', 'call_queue'): 7,               # Forward to call queue
+    ('Voicemail', 'call_queue'): 400,           # Leave voicemail to call queue
+    ('Transfer', 'call_queue'): 10,             # Forward to phone number
+    ('ConnectToOperator', 'call_queue'): 7,     # Forward to call queue (operator queue)
+    ('DialByName', 'call_queue'): 4,            # Forward to common area
+    # auto_receptionist
+    ('Connect', 'auto_receptionist'): 6,        # Forward to auto receptionist
+    ('Voicemail', 'auto_receptionist'): 300,    # Leave voicemail to auto receptionist
+    ('Transfer', 'auto_receptionist'): 10,      # Forward to phone number
+    ('ConnectToOperator', 'auto_receptionist'): 6,  # Forward to auto receptionist
+    ('DialByName', 'auto_receptionist'): 4,     # Forward to common area
+    # universal
+    ('Repeat', None): 21,                       # Repeat menu greeting
+    ('ReturnToRoot', None): 22,                 # Return to root menu
+    ('ReturnToPrevious', None): 23,             # Return to previous menu
+    ('Disconnect', None): -1,                   # Disabled
+    ('ReturnToTopLevelMenu', None): 22,         # Return to root menu
+    ('DoNothing', None): -1,                    # Disabled
+}
+
+# One concat() argument, split as the original character loop did: text up to a
+# quote plus the quoted text (kept unstripped when the quote closes), or a bare
+# run between commas. Commas outside quotes are skipped by findall.
+_CONCAT_ARG_RE = re.compile(r'([^",]*)"([^"]*)("?)|([^",]+)')
+
+# Address abbreviations upper-cased by normalize_address_field after title-casing:
+# anywhere as a space-delimited word, and the street-type subset at the end of the value
+_ADDRESS_MID_TOKENS = (
+    'Po',    # PO Box
+    'Ne',    # Northeast
+    'Nw',    # Northwest
+    'Se',    # Southeast
+    'Sw',    # Southwest
+    'Ct',    # Court
+    'St',    # Street
+    'Ave',   # Avenue
+    'Blvd',  # Boulevard
+    'Dr',    # Drive
+    'Ln',    # Lane
+    'Rd',    # Road
+    'Apt',   # Apartment
+    'Ste',   # Suite
+)
+_ADDRESS_END_TOKENS = ('Ct', 'St', 'Ave', 'Blvd', 'Dr', 'Ln', 'Rd')
+_ADDRESS_MID_RE = re.compile(r' (?:%s)(?= )' % '|'.join(_ADDRESS_MID_TOKENS))
+_ADDRESS_END_RE = re.compile(r' (?:%s)\Z' % '|'.join(_ADDRESS_END_TOKENS))
+
+
+def _upper_address_token(match: "re.Match[str]") -> str:
+    return match.group(0).upper()
+
+
+# map_user_type() codes for apply_user_type_mapping; anything else defaults to 1 (User)
+_USER_TYPE_CODES = {
+    'User': 1,
+    'DigitalUser': 2
+}
+
+# RingCentral user type to Zoom user type (1=User, 2=DigitalUser, 99=Other)
+ZOOM_TYPE_MAP = {
+    'User': 1,
+    'DigitalUser': 2,
+    'FlexibleUser': 1,  # Map to regular user
+    'FaxUser': 99,
+    'VirtualUser': 99,
+    'Department': 99,
+    'Announcement': 99,
+    'Voicemail': 99,
+    'SharedLinesGroup': 99,
+    'PagingOnly': 99,
+    'IvrMenu': 99,
+    'ApplicationExtension': 99,
+    'ParkLocation': 99,
+    'Limited': 99,
+    'Bot': 99,
+    'ProxyAdmin': 99,
+    'DelegatedLinesGroup': 99,
+    'Site': 99
+}
+
+
+
+@lru_cache(maxsize=512)
+def _auto_receptionist_name(site_name: str, max_length: int) -> str:
+    # Body of ZoomTransformerHelper.process_auto_receptionist_name for valid names,
+    # memoized per (site_name, max_length)
+    
+    # Clean and normalize the site name
+    clean_name = site_name.strip()
+    suffix = " (NIU)"  # Abbreviated form of "(NOT IN USE)"
+    
+    # If the full name + suffix fits, use it
+    full_name = clean_name + suffix
+    if len(full_name) <= max_length:
+        logger.info("AR name fits within limit: '%s' (%s chars)", full_name, len(full_name))
+        return full_name
+    
+    # Calculate available space for the base name
+    available_for_base = max_length - len(suffix)
+    
+    if available_for_base > 0:
+        # Truncate base name to fit with suffix
+        truncated_base = clean_name[:available_for_base].rstrip()
+        result = truncated_base + suffix
+        logger.info("AR name truncated to fit: '%s' -> '%s' (%s chars)", site_name, result, len(result))
+        return result
+    else:
+        # Suffix itself is too long for the limit (shouldn't happen with 30 char limit)
+        result = suffix[:max_length]
+        logger.warning("Suffix too long for limit, using: '%s' (%s chars)", result, len(result))
+        return result
+
+
+def _transform_user_record(
+    inplace: bool,
+    transform_timezone: Callable[[Any], Optional[str]],
+    log_info: Optional[Callable[..., None]],
+    user_record: Dict[str, Any]
+) -> Dict[str, Any]:
+    # Per-record body shared by ZoomTransformerHelper.transform_user_data and
+    # build_user_transform; log_info is None when INFO logging is disabled.
+    # The record comes last so build_user_transform can bind the rest with partial
+    transformed = user_record if inplace else dict(user_record)
+    
+    if 'contact' in user_record:
+        contact = transformed.pop('contact')
+        user_info = {
+            'first_name': contact.get('firstName', ''),
+            'last_name': contact.get('lastName', ''),
+            'email': contact.get('email', ''),
+            'phone_number': contact.get('businessPhone', ''),
+            'timezone': transform_timezone(user_record.get('regionalSettings', {}))
+        }
+        transformed['user_info'] = user_info
+    else:
+        user_info = transformed.setdefault('user_info', {})
+    
+    rc_type = user_record.get('type')
+    if rc_type:
+        user_info['type'] = rc_type
+        if log_info:
+            log_info("Mapped RingCentral type %s to user_info.type for user %s", rc_type, transformed.get('id', 'unknown'))
+    else:
+        user_info['type'] = 1  # Default fallback
+        if log_info:
+            log_info("Set default user_info.type = 1 for user %s", transformed.get('id', 'unknown'))
+    
+    return transformed
+
 
 class ZoomTransformerHelper:
     """
@@ -20,73 +244,44 @@ class ZoomTransformerHelper:
     but should be executed during the transform phase, not the load phase.
     """
     
-    # Weekday name to number mapping (Zoom API format) - from ZoomBusinessHoursHelper
-    WEEKDAY_MAPPING = {
-        'sunday': 1,
-        'monday': 2,
-        'tuesday': 3,
-        'wednesday': 4,
-        'thursday': 5,
-        'friday': 6,
-        'saturday': 7
-    }
-    
-    # IVR-related constants - from ZoomIVRHelper
-    ACTIONS_WITHOUT_TARGET = [-1, 21, 22, 23]  # Disabled, Repeat, Return to root, Return to previous
+    # Lookup tables, aliased from module level for backward compatibility
+    WEEKDAY_MAPPING = _WEEKDAY_MAPPING
+    ACTIONS_WITHOUT_TARGET = _ACTIONS_WITHOUT_TARGET
+    INPUT_KEY_MAPPINGS = _INPUT_KEY_MAPPINGS
+    RC_TO_IANA_MAPPING = _RC_TO_IANA_MAPPING
     
-    # Input key mappings from RingCentral to Zoom
-    INPUT_KEY_MAPPINGS = {
-        'Star': '*',
-        'Hash': '#',
-        'NoInput': 'timeout',
-        # Numbers stay the same: '1' -> '1', '2' -> '2', etc.
-    }
+    # Process-wide instance returned by shared()
+    _shared_instance = None
     
-    # RingCentral to IANA timezone mappings - from TimezoneConverter
-    RC_TO_IANA_MAPPING = {
-        # US Timezones
-        'Pacific Standard Time': 'America/Los_Angeles',
-        'Pacific Daylight Time': 'America/Los_Angeles', 
-        'Mountain Standard Time': 'America/Denver',
-        'Mountain Daylight Time': 'America/Denver',
-        'Central Standard Time': 'America/Chicago',
-        'Central Daylight Time': 'America/Chicago',
-        'Eastern Standard Time': 'America/New_York',
-        'Eastern Daylight Time': 'America/New_York',
-        'Atlantic Standard Time': 'America/Halifax',
-        'Atlantic Daylight Time': 'America/Halifax',
-        'Alaska Standard Time': 'America/Anchorage',
-        'Alaska Daylight Time': 'America/Anchorage',
-        'Hawaii Standard Time': 'Pacific/Honolulu',
-        
-        # International Timezones
-        'Greenwich Mean Time': 'Europe/London',
-        'British Summer Time': 'Europe/London',
-        'Central European Time': 'Europe/Paris',
-        'Central European Summer Time': 'Europe/Paris',
-        'Eastern European Time': 'Europe/Bucharest',
-        'Eastern European Summer Time': 'Europe/Bucharest',
-        'Japan Standard Time': 'Asia/Tokyo',
-        'China Standard Time': 'Asia/Shanghai',
-        'Australian Eastern Standard Time': 'Australia/Sydney',
-        'Australian Eastern Daylight Time': 'Australia/Sydney',
-        
-        # Additional common mappings
-        'UTC': 'UTC',
-        'GMT': 'UTC',
-        'PST': 'America/Los_Angeles',
-        'PDT': 'America/Los_Angeles',
-        'MST': 'America/Denver', 
-        'MDT': 'America/Denver',
-        'CST': 'America/Chicago',
-        'CDT': 'America/Chicago',
-        'EST': 'America/New_York',
-        'EDT': 'America/New_York',
-    }
+    # Per-class child logger, resolved on first instantiation
+    _class_logger = None
     
     def __init__(self):
         """Initialize the Zoom transformer helper."""
-        self.logger = logger.getChild(self.__class__.__name__)
+        cls = self.__class__
+        class_logger = cls.__dict__.get('_class_logger')
+        if class_logger is None:
+            # getChild takes the logging module lock, so do it once per class
+            class_logger = logger.getChild(cls.__name__)
+            cls._class_logger = class_logger
+        self.logger = class_logger
+    
+    @classmethod
+    def shared(cls) -> "ZoomTransformerHelper":
+        """
+        Return a shared instance of this helper class.
+        
+        The helper keeps no per-transformer state, so transformers can reuse a
+        single instance instead of constructing their own.
+        
+        Returns:
+            Shared helper instance (one per helper class)
+        """
+        instance = cls.__dict__.get('_shared_instance')
+        if instance is None:
+            instance = cls()
+            cls._shared_instance = instance
+        return instance
     
     def transform_emergency_address(self, business_address: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -111,28 +306,23 @@ class ZoomTransformerHelper:
         Returns:
             Transformed emergency address for Zoom
         """
-        if not business_address:
-            return {}
-            
-        try:
-            # Get country and convert to ISO code
-            country_name = business_address.get('country', '')
-            country_iso = ZoomTransformerHelper.convert_country_to_iso(country_name) if country_name else ''
-            
-            transformed_address = {
-                'address_line1': business_address.get('street', ''),
-                'city': business_address.get('city', ''),
-                'state_code': business_address.get('state', ''),
-                'zip': business_address.get('zip', ''),
-                'country': country_iso
-            }
-            
-            self.logger.debug(f"Transformed emergency address: {transformed_address}")
-            return transformed_address
-            
-        except Exception as e:
-            self.logger.error(f"Error transforming emergency address: {str(e)}")
+        if not business_address or not isinstance(business_address, dict):
             return {}
+        
+        # Get country and convert to ISO code
+        country_name = business_address.get('country', '')
+        country_iso = _COUNTRY_TO_ISO.get(country_name, country_name) if country_name else ''
+        
+        transformed_address = {
+            'address_line1': business_address.get('street', ''),
+            'city': business_address.get('city', ''),
+            'state_code': business_address.get('state', ''),
+            'zip': business_address.get('zip', ''),
+            'country': country_iso
+        }
+        
+        self.logger.debug("Transformed emergency address: %s", transformed_address)
+        return transformed_address
     
     def transform_timezone_to_iana(self, timezone_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -148,46 +338,27 @@ class ZoomTransformerHelper:
         """
         if not timezone_data:
             return None
-            
-        try:
-            # Handle RingCentral timezone format to IANA conversion
-            if isinstance(timezone_data, dict):
-                if 'id' in timezone_data:
-                    # Map RingCentral timezone IDs to IANA format
-                    rc_to_iana_map = {
-                        '58': 'America/New_York',
-                        '59': 'America/Chicago', 
-                        '60': 'America/Denver',
-                        '61': 'America/Los_Angeles',
-                        '62': 'America/Phoenix',
-                        '63': 'America/Anchorage',
-                        '64': 'Pacific/Honolulu'
-                    }
-                    return rc_to_iana_map.get(str(timezone_data['id']))
-                    
-                if 'name' in timezone_data:
-                    # Handle timezone name to IANA conversion
-                    name_to_iana_map = {
-                        'Eastern Time': 'America/New_York',
-                        'Central Time': 'America/Chicago',
-                        'Mountain Time': 'America/Denver', 
-                        'Pacific Time': 'America/Los_Angeles',
-                        'Alaska Time': 'America/Anchorage',
-                        'Hawaii Time': 'Pacific/Honolulu'
-                    }
-                    return name_to_iana_map.get(timezone_data['name'])
-            
-            elif isinstance(timezone_data, str):
-                # Handle direct string timezone values
-                return timezone_data if timezone_data.startswith('America/') or timezone_data.startswith('Pacific/') else None
+        
+        # Handle RingCentral timezone format to IANA conversion
+        if isinstance(timezone_data, dict):
+            if 'id' in timezone_data:
+                # Map RingCentral timezone IDs to IANA format
+                return RC_ID_TO_IANA_MAPPING.get(str(timezone_data['id']))
                 
+            if 'name' in timezone_data:
+                # Handle timezone name to IANA conversion
+                name = timezone_data['name']
+                return COMMON_NAME_TO_IANA_MAPPING.get(name) if isinstance(name, str) else None
+        
+        elif isinstance(timezone_data, str):
+            # Handle direct string timezone values
+            if _is_iana_name(timezone_data):
+                return timezone_data
             return None
             
-        except Exception as e:
-            self.logger.error(f"Error converting timezone to IANA: {str(e)}")
-            return None
+        return None
     
-    def transform_user_data(self, user_record: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_user_data(self, user_record: Dict[str, Any], *, inplace: bool = False) -> Dict[str, Any]:
         """
         Transform user data for JobType 39 (RingCentral to Zoom - Users).
         
@@ -198,42 +369,63 @@ class ZoomTransformerHelper:
         
         Args:
             user_record: Raw user record from RingCentral
+            inplace: Rewrite user_record itself instead of a copy; only for callers
+                that own the record and do not read it again
             
         Returns:
             Transformed user record ready for loading
         """
-        transformed = dict(user_record)  # Copy original
-        
-        # Transform contact fields to user_info structure
-        if 'contact' in user_record:
-            contact = user_record['contact']
-            transformed['user_info'] = {
-                'first_name': contact.get('firstName', ''),
-                'last_name': contact.get('lastName', ''),
-                'email': contact.get('email', ''),
-                'phone_number': contact.get('businessPhone', ''),
-                'timezone': self.transform_timezone_to_iana(user_record.get('regionalSettings', {}))
-            }
-            # Remove original field after transformation
-            del transformed['contact']
+        log_info = logger.info if logger.isEnabledFor(logging.INFO) else None
+        transformed = _transform_user_record(inplace, self.transform_timezone_to_iana, log_info, user_record)
         
-        # Map RingCentral type to user_info.type, with fallback to 1
-        if 'user_info' not in transformed:
-            transformed['user_info'] = {}
+        if log_info:
+            log_info("Successfully transformed user data for user %s", transformed.get('id', 'unknown'))
+        return transformed
+    
+    def build_user_transform(self, *, inplace: bool = False) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build a per-record JobType 39 user transform with its lookups resolved up front.
         
-        # Use RingCentral type if available, otherwise default to 1
-        if 'type' in user_record and user_record['type']:
-            transformed['user_info']['type'] = user_record['type']
-            logger.info(f"Mapped RingCentral type {user_record['type']} to user_info.type for user {transformed.get('id', 'unknown')}")
-        else:
-            transformed['user_info']['type'] = 1  # Default fallback
-            logger.info(f"Set default user_info.type = 1 for user {transformed.get('id', 'unknown')}")
+        transform_user_data() is this transform plus a per-user success log
+        line. The INFO level is sampled once here, so build a fresh transform
+        per batch.
         
-        logger.info(f"Successfully transformed user data for user {transformed.get('id', 'unknown')}")
-        return transformed
+        Args:
+            inplace: Rewrite each record itself instead of a copy (see transform_user_data)
+        
+        Returns:
+            Function mapping a raw RingCentral user record to its transformed copy
+        """
+        log_info = logger.info if logger.isEnabledFor(logging.INFO) else None
+        return partial(_transform_user_record, inplace, self.transform_timezone_to_iana, log_info)
+    
+    def transform_user_data_batch(
+        self,
+        user_records: List[Dict[str, Any]],
+        *,
+        inplace: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform many user records for JobType 39 in one pass.
+        
+        Produces the same records as calling transform_user_data() on each item,
+        using a single transform from build_user_transform() for the whole batch.
+        
+        Args:
+            user_records: Raw user records from RingCentral
+            inplace: Rewrite each record itself instead of a copy (see transform_user_data)
+            
+        Returns:
+            Transformed user records, in input order
+        """
+        apply = self.build_user_transform(inplace=inplace)
+        results = [apply(user_record) for user_record in user_records]
+        
+        logger.info("Successfully transformed user data for %s users", len(results))
+        return results
     
     @staticmethod
-    def transform_business_hours_data(record: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_business_hours_data(record: Dict[str, Any], inplace: bool = False) -> Dict[str, Any]:
         """
         Transform business hours data from weeklyRanges format to Zoom's custom_hours_settings array.
         
@@ -241,59 +433,60 @@ class ZoomTransformerHelper:
         
         Args:
             record: The record containing business_hours.schedule.weeklyRanges data
+            inplace: Add custom_hours_settings to record itself instead of a copy
             
         Returns:
             Record with transformed custom_hours_settings array
         """
         if not isinstance(record, dict):
             return record
-            
-        # Make a copy to avoid modifying the original
-        transformed_record = record.copy()
         
         # Check if business hours data exists
         business_hours = record.get('business_hours')
         if not business_hours:
             logger.info("No business_hours data found in record")
-            return transformed_record
+            return record if inplace else record.copy()
             
         schedule = business_hours.get('schedule', {})
         weekly_ranges = schedule.get('weeklyRanges', {})
         
         if not weekly_ranges:
             logger.info("No weeklyRanges data found in business_hours")
-            return transformed_record
+            return record if inplace else record.copy()
             
-        logger.info(f"Transforming weeklyRanges with {len(weekly_ranges)} days: {list(weekly_ranges.keys())}")
+        logger.info("Transforming weeklyRanges with %s days: %s", len(weekly_ranges), list(weekly_ranges.keys()))
         
         # Transform to custom_hours_settings array
         custom_hours_settings = []
+        append = custom_hours_settings.append
+        weekday_mapping = _WEEKDAY_MAPPING
         
         for day_name, time_ranges in weekly_ranges.items():
-            day_name_lower = day_name.lower()
+            weekday_number = weekday_mapping.get(day_name.lower())
             
-            if day_name_lower not in ZoomTransformerHelper.WEEKDAY_MAPPING:
-                logger.warning(f"Unknown weekday: {day_name}, skipping")
+            if weekday_number is None:
+                logger.warning("Unknown weekday: %s, skipping", day_name)
                 continue
-                
-            weekday_number = ZoomTransformerHelper.WEEKDAY_MAPPING[day_name_lower]
             
             # Handle multiple time ranges per day (if any)
             if isinstance(time_ranges, list) and time_ranges:
                 for time_range in time_ranges:
                     if isinstance(time_range, dict) and 'from' in time_range and 'to' in time_range:
-                        custom_hours_settings.append({
+                        append({
                             'weekday': weekday_number,
                             'from': time_range['from'],
                             'to': time_range['to'],
                             'type': 2  # Custom hours
                         })
-                        logger.info(f"Added custom hours for {day_name}: {time_range['from']}-{time_range['to']}")
+                        logger.info("Added custom hours for %s: %s-%s", day_name, time_range['from'], time_range['to'])
+        
+        # Copy only once the record is known to be transformed
+        transformed_record = record if inplace else record.copy()
         
         if custom_hours_settings:
             # Add the transformed data to the record
             transformed_record['custom_hours_settings'] = custom_hours_settings
-            logger.info(f"Successfully transformed {len(custom_hours_settings)} time slots to custom_hours_settings")
+            logger.info("Successfully transformed %s time slots to custom_hours_settings", len(custom_hours_settings))
         else:
             logger.warning("No valid time ranges found in weeklyRanges data")
             
@@ -312,9 +505,9 @@ class ZoomTransformerHelper:
         Returns:
             Zoom-compatible input key ('*', '#', '1', '2', etc.)
         """
-        mapped_key = ZoomTransformerHelper.INPUT_KEY_MAPPINGS.get(rc_input, rc_input)
+        mapped_key = _INPUT_KEY_MAPPINGS.get(rc_input, rc_input)
         if mapped_key != rc_input:
-            logger.info(f"INPUT_MAPPING: Mapped '{rc_input}' → '{mapped_key}'")
+            logger.info("INPUT_MAPPING: Mapped '%s' → '%s'", rc_input, mapped_key)
         return mapped_key
     
     @staticmethod
@@ -356,7 +549,7 @@ class ZoomTransformerHelper:
         Returns:
             Zoom ID (user_id, queue_id, or AR ID) or None if not found
         """
-        logger.info(f"IVR_RESOLVE: CALLED with job_group_id={job_group_id}, rc_extension_id={rc_extension_id}, extension_type={extension_type}")
+        logger.info("IVR_RESOLVE: CALLED with job_group_id=%s, rc_extension_id=%s, extension_type=%s", job_group_id, rc_extension_id, extension_type)
         try:
             # In the microservice, we'll need to implement this differently
             # as we don't have direct access to the Django ORM
@@ -382,61 +575,28 @@ class ZoomTransformerHelper:
         Returns:
             Zoom action integer code
         """
-        # Target-specific action mappings
-        type_specific_mappings = {
-            'user': {
-                'Connect': 2,           # Forward to user
-                'Voicemail': 200,       # Leave voicemail to user
-                'Transfer': 10,         # Forward to phone number
-                'ConnectToOperator': 2, # Forward to user (operator)
-                'DialByName': 4,        # Forward to common area (closest match)
-            },
-            'call_queue': {
-                'Connect': 7,           # Forward to call queue
-                'Voicemail': 400,       # Leave voicemail to call queue
-                'Transfer': 10,         # Forward to phone number
-                'ConnectToOperator': 7, # Forward to call queue (operator queue)
-                'DialByName': 4,        # Forward to common area
-            },
-            'auto_receptionist': {
-                'Connect': 6,           # Forward to auto receptionist
-                'Voicemail': 300,       # Leave voicemail to auto receptionist
-                'Transfer': 10,         # Forward to phone number
-                'ConnectToOperator': 6, # Forward to auto receptionist
-                'DialByName': 4,        # Forward to common area
-            }
-        }
-        
-        # Universal actions (same for all target types)
-        universal_mappings = {
-            'Repeat': 21,                    # Repeat menu greeting
-            'ReturnToRoot': 22,              # Return to root menu
-            'ReturnToPrevious': 23,          # Return to previous menu
-            'Disconnect': -1,                # Disabled
-            'ReturnToTopLevelMenu': 22,      # Return to root menu
-            'DoNothing': -1,                 # Disabled
-        }
-        
         # Check universal actions first
-        if rc_action in universal_mappings:
-            action_code = universal_mappings[rc_action]
-            logger.info(f"ACTION_MAPPING: Universal action '{rc_action}' → {action_code}")
+        action_code = _ACTION_CODES.get((rc_action, None))
+        if action_code is not None:
+            logger.info("ACTION_MAPPING: Universal action '%s' → %s", rc_action, action_code)
             return action_code
         
         # Check target-specific mappings
-        if target_type in type_specific_mappings:
-            target_mappings = type_specific_mappings[target_type]
-            if rc_action in target_mappings:
-                action_code = target_mappings[rc_action]
-                logger.info(f"ACTION_MAPPING: '{rc_action}' for {target_type} → {action_code}")
-                return action_code
+        action_code = _ACTION_CODES.get((rc_action, target_type))
+        if action_code is not None:
+            logger.info("ACTION_MAPPING: '%s' for %s → %s", rc_action, target_type, action_code)
+            return action_code
         
         # Fallback for unknown actions
-        logger.warning(f"ACTION_MAPPING: Unknown action '{rc_action}' for target_type '{target_type}', using -1 (disabled)")
+        logger.warning("ACTION_MAPPING: Unknown action '%s' for target_type '%s', using -1 (disabled)", rc_action, target_type)
         return -1
     
     @staticmethod  
-    def process_ivr_payload(resolved_item: Dict[str, Any], job_group_id: Optional[int] = None) -> Dict[str, Any]:
+    def process_ivr_payload(
+        resolved_item: Dict[str, Any],
+        job_group_id: Optional[int] = None,
+        inplace: bool = False
+    ) -> Dict[str, Any]:
         """
         Process a resolved IVR item to handle Zoom-specific requirements with enhanced action mapping.
         
@@ -445,6 +605,7 @@ class ZoomTransformerHelper:
         Args:
             resolved_item: The resolved payload item with placeholders replaced
             job_group_id: Optional job group ID for extension type detection
+            inplace: Rewrite resolved_item itself instead of a copy (for callers that own it)
             
         Returns:
             Processed payload item with correct structure for Zoom API
@@ -452,8 +613,8 @@ class ZoomTransformerHelper:
         if not isinstance(resolved_item, dict):
             return resolved_item
             
-        # Make a copy to avoid modifying the original
-        processed_item = resolved_item.copy()
+        # Make a copy to avoid modifying the original unless the caller owns it
+        processed_item = resolved_item if inplace else resolved_item.copy()
         
         # Map input key from RingCentral format to Zoom format
         if 'key' in processed_item:
@@ -476,24 +637,24 @@ class ZoomTransformerHelper:
                 detected_type = ZoomTransformerHelper.get_extension_type_from_job_group(job_group_id, extension_id)
                 if detected_type:
                     target_type = detected_type
-                    logger.info(f"IVR_PROCESSING: Detected extension {extension_id} as {target_type}")
+                    logger.info("IVR_PROCESSING: Detected extension %s as %s", extension_id, target_type)
                 else:
-                    logger.warning(f"IVR_PROCESSING: Could not detect type for extension {extension_id}, using default 'user'")
+                    logger.warning("IVR_PROCESSING: Could not detect type for extension %s, using default 'user'", extension_id)
             
             # Map RingCentral action to appropriate Zoom action code
             if rc_action:
                 zoom_action_code = ZoomTransformerHelper.map_rc_action_to_zoom(rc_action, target_type)
                 processed_item['action'] = zoom_action_code
-                logger.info(f"IVR_PROCESSING: Mapped RC action '{rc_action}' to Zoom code {zoom_action_code} for {target_type}")
+                logger.info("IVR_PROCESSING: Mapped RC action '%s' to Zoom code %s for %s", rc_action, zoom_action_code, target_type)
             
             # Handle target field based on action requirements
             numeric_action = processed_item.get('action')
             
             # Remove target field for actions that don't need it
-            if numeric_action in ZoomTransformerHelper.ACTIONS_WITHOUT_TARGET:
+            if numeric_action in _ACTIONS_WITHOUT_TARGET:
                 if 'target' in processed_item:
                     del processed_item['target']
-                    logger.info(f"IVR_PROCESSING: Removed target field for action {numeric_action} (doesn't need target)")
+                    logger.info("IVR_PROCESSING: Removed target field for action %s (doesn't need target)", numeric_action)
             
             # For actions that need target but have empty/invalid extension_id, remove target
             elif 'target' in processed_item:
@@ -503,16 +664,11 @@ class ZoomTransformerHelper:
                     # If extension_id is empty, None, or still a placeholder, remove target
                     if not target_extension_id or target_extension_id.startswith('{'):
                         del processed_item['target']
-                        logger.info(f"IVR_PROCESSING: Removed target field for action {numeric_action} (empty extension_id)")
+                        logger.info("IVR_PROCESSING: Removed target field for action %s (empty extension_id)", numeric_action)
                     else:
                         # Update target type in the target object for Zoom API
-                        zoom_target_type_mapping = {
-                            'user': 'user',
-                            'call_queue': 'call_queue', 
-                            'auto_receptionist': 'auto_receptionist'
-                        }
-                        processed_item['target']['type'] = zoom_target_type_mapping.get(target_type, 'user')
-                        logger.info(f"IVR_PROCESSING: Set target type to {processed_item['target']['type']}")
+                        processed_item['target']['type'] = _ZOOM_TARGET_TYPES.get(target_type, 'user')
+                        logger.info("IVR_PROCESSING: Set target type to %s", processed_item['target']['type'])
         
         return processed_item
     
@@ -542,17 +698,17 @@ class ZoomTransformerHelper:
                 audio_uri = audio_data.get('uri') or audio_data.get('id')
                 if audio_uri:
                     processed_prompt['audio_prompt_id'] = audio_uri
-                    logger.info(f"PROMPT_MAPPING: Mapped audio URI/ID {audio_uri}")
+                    logger.info("PROMPT_MAPPING: Mapped audio URI/ID %s", audio_uri)
         
         # Handle text prompts as fallback
         if 'text' in prompt_data:
             processed_prompt['text_prompt'] = prompt_data['text']
-            logger.info(f"PROMPT_MAPPING: Added text prompt")
+            logger.info("PROMPT_MAPPING: Added text prompt")
         
         # Default prompt mode
         processed_prompt['mode'] = prompt_data.get('mode', 'Audio')
         
-        logger.info(f"PROMPT_MAPPING: Processed prompt with mode {processed_prompt.get('mode')}")
+        logger.info("PROMPT_MAPPING: Processed prompt with mode %s", processed_prompt.get('mode'))
         return processed_prompt
     
     @staticmethod
@@ -608,77 +764,31 @@ class ZoomTransformerHelper:
             Transformed action in Zoom format, or None if transformation fails
         """
         if not isinstance(action, dict):
-            logger.warning(f"Invalid action format, expected dict: {action}")
+            logger.warning("Invalid action format, expected dict: %s", action)
             return None
             
         try:
-            logger.info(f"IVR_DEBUG: transform_ivr_action START")
-            transformed = {}
+            logger.info("IVR_DEBUG: transform_ivr_action START")
             
-            # Handle both RingCentral format and already-transformed Zoom format
-            
-            # 1. Handle key field (input mapping)
-            if 'input' in action:
-                # RingCentral format - transform input to key
-                rc_input = action.get('input', '')
-                transformed['key'] = ZoomTransformerHelper.map_input_key(rc_input)
-            elif 'key' in action:
-                # Already in Zoom format - keep existing key
-                transformed['key'] = action.get('key')
-            
-            # 2. Determine target type from extension information  
+            # Determine target type from extension information
             target_type = 'user'  # Default fallback
-            extension_id = None
-            
-            # Handle both RingCentral format (extension.id) and Zoom format (target.extension_id)
-            if 'extension' in action and isinstance(action['extension'], dict):
-                extension_id = action['extension'].get('id')
-            elif 'target' in action and isinstance(action['target'], dict):
-                extension_id = action['target'].get('extension_id')
+            extension_id = ZoomTransformerHelper._ivr_extension_id(action)
                 
             # Try to determine extension type using job group data
-            logger.info(f"IVR_DEBUG: job_group_id={job_group_id}, extension_id={extension_id}")
+            logger.info("IVR_DEBUG: job_group_id=%s, extension_id=%s", job_group_id, extension_id)
             if job_group_id and extension_id:
-                logger.info(f"IVR_DEBUG: Calling get_extension_type_from_job_group({job_group_id}, {extension_id})")
+                logger.info("IVR_DEBUG: Calling get_extension_type_from_job_group(%s, %s)", job_group_id, extension_id)
                 detected_type = ZoomTransformerHelper.get_extension_type_from_job_group(job_group_id, extension_id)
-                logger.info(f"IVR_DEBUG: get_extension_type_from_job_group returned: {detected_type}")
+                logger.info("IVR_DEBUG: get_extension_type_from_job_group returned: %s", detected_type)
                 if detected_type:
                     target_type = detected_type
-                    logger.info(f"IVR_PROCESSING: Detected extension {extension_id} as {target_type}")
+                    logger.info("IVR_PROCESSING: Detected extension %s as %s", extension_id, target_type)
                 else:
-                    logger.warning(f"IVR_PROCESSING: Could not detect type for extension {extension_id}, using default 'user'")
+                    logger.warning("IVR_PROCESSING: Could not detect type for extension %s, using default 'user'", extension_id)
             else:
-                logger.warning(f"IVR_DEBUG: Skipping extension type detection - job_group_id={job_group_id}, extension_id={extension_id}")
+                logger.warning("IVR_DEBUG: Skipping extension type detection - job_group_id=%s, extension_id=%s", job_group_id, extension_id)
             
-            # 3. Handle action field (action mapping)
-            if isinstance(action.get('action'), str):
-                # RingCentral format - transform string action to integer code
-                rc_action = action.get('action', '')
-                zoom_action_code = ZoomTransformerHelper.map_rc_action_to_zoom(rc_action, target_type)
-            else:
-                # Already in Zoom format - keep existing action code
-                zoom_action_code = action.get('action')
-            transformed['action'] = zoom_action_code
-            
-            # 4. Handle target field based on action requirements
-            # Actions that don't need a target field: [-1, 21, 22, 23] (Disabled, Repeat, Return to root, Return to previous)
-            ACTIONS_WITHOUT_TARGET = [-1, 21, 22, 23]
-            
-            if zoom_action_code not in ACTIONS_WITHOUT_TARGET and extension_id:
-                # Keep RingCentral extension ID - let loader handle Zoom ID resolution via dependencies
-                zoom_target_type_mapping = {
-                    'user': 'user',
-                    'call_queue': 'call_queue', 
-                    'auto_receptionist': 'auto_receptionist'
-                }
-                transformed['target'] = {
-                    'type': zoom_target_type_mapping.get(target_type, 'user'),
-                    'extension_id': extension_id  # Keep RC extension ID for loader to resolve
-                }
-                logger.info(f"IVR_PROCESSING: Set target type to {target_type} with RC extension_id {extension_id} for loader resolution")
-            
-            logger.info(f"IVR_MAPPING: Transformed action '{action.get('action')}' input '{action.get('input')}' → code {zoom_action_code} for {target_type}")
-            return transformed
+            return ZoomTransformerHelper._build_zoom_ivr_action(action, extension_id, target_type)
             
         except Exception as e:
             logger.error(f"IVR_DEBUG: Error transforming IVR action {action}: {str(e)}")
@@ -686,6 +796,98 @@ class ZoomTransformerHelper:
             logger.error(f"IVR_DEBUG: Full traceback: {traceback.format_exc()}")
             return None
 
+    @staticmethod
+    def _ivr_extension_id(action: Dict[str, Any]) -> Optional[str]:
+        # Handle both RingCentral format (extension.id) and Zoom format (target.extension_id)
+        extension = action.get('extension')
+        if isinstance(extension, dict):
+            return extension.get('id')
+        target = action.get('target')
+        if isinstance(target, dict):
+            return target.get('extension_id')
+        return None
+
+    @staticmethod
+    def _build_zoom_ivr_action(action: Dict[str, Any], extension_id: Optional[str], target_type: str) -> Dict[str, Any]:
+        # Shared by transform_ivr_action and transform_ivr_actions_batch once the target type is known
+        transformed = {}
+        
+        # 1. Handle key field (input mapping)
+        if 'input' in action:
+            # RingCentral format - transform input to key
+            transformed['key'] = ZoomTransformerHelper.map_input_key(action.get('input', ''))
+        elif 'key' in action:
+            # Already in Zoom format - keep existing key
+            transformed['key'] = action.get('key')
+        
+        # 2. Handle action field (action mapping)
+        rc_action = action.get('action')
+        if isinstance(rc_action, str):
+            # RingCentral format - transform string action to integer code
+            zoom_action_code = ZoomTransformerHelper.map_rc_action_to_zoom(rc_action, target_type)
+        else:
+            # Already in Zoom format - keep existing action code
+            zoom_action_code = rc_action
+        transformed['action'] = zoom_action_code
+        
+        # 3. Handle target field based on action requirements
+        # Actions that don't need a target field: [-1, 21, 22, 23] (Disabled, Repeat, Return to root, Return to previous)
+        if zoom_action_code not in _ACTIONS_WITHOUT_TARGET and extension_id:
+            # Keep RingCentral extension ID - let loader handle Zoom ID resolution via dependencies
+            transformed['target'] = {
+                'type': _ZOOM_TARGET_TYPES.get(target_type, 'user'),
+                'extension_id': extension_id  # Keep RC extension ID for loader to resolve
+            }
+            logger.info("IVR_PROCESSING: Set target type to %s with RC extension_id %s for loader resolution", target_type, extension_id)
+        
+        logger.info("IVR_MAPPING: Transformed action '%s' input '%s' → code %s for %s", rc_action, action.get('input'), zoom_action_code, target_type)
+        return transformed
+
+    @staticmethod
+    def transform_ivr_actions_batch(actions: List[Dict[str, Any]], job_group_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Transform a list of IVR actions from RingCentral format to Zoom format.
+        
+        Each distinct extension is classified once per batch instead of once per
+        action; results match transform_ivr_action(), with invalid actions dropped.
+        
+        Args:
+            actions: IVR actions from RingCentral ivr_details[0].actions
+            job_group_id: Optional job group ID for extension type detection
+            
+        Returns:
+            Transformed actions in Zoom format, in input order
+        """
+        detect_type = ZoomTransformerHelper.get_extension_type_from_job_group
+        build = ZoomTransformerHelper._build_zoom_ivr_action
+        
+        # Detected type per extension id, falling back to 'user' like the single-action path
+        target_types = {}
+        transformed_actions = []
+        for action in actions:
+            if not isinstance(action, dict):
+                logger.warning("Invalid action format, expected dict: %s", action)
+                continue
+            try:
+                extension_id = ZoomTransformerHelper._ivr_extension_id(action)
+                target_type = 'user'
+                if job_group_id and extension_id:
+                    try:
+                        target_type = target_types.get(extension_id)
+                    except TypeError:
+                        # Unhashable id: classify it without caching
+                        target_type = detect_type(job_group_id, extension_id) or 'user'
+                    else:
+                        if target_type is None:
+                            target_type = detect_type(job_group_id, extension_id) or 'user'
+                            target_types[extension_id] = target_type
+                transformed_actions.append(build(action, extension_id, target_type))
+            except Exception as e:
+                logger.error("IVR_DEBUG: Error transforming IVR action %s: %s", action, e)
+        
+        logger.info("IVR_PROCESSING: Transformed %s of %s IVR actions", len(transformed_actions), len(actions))
+        return transformed_actions
+
     @staticmethod
     def build_enhanced_ivr_payload(record_data: Dict[str, Any], job_group_id: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -706,12 +908,14 @@ class ZoomTransformerHelper:
         if 'actions' in record_data:
             actions = record_data['actions']
             if isinstance(actions, list):
-                processed_actions = []
-                for action in actions:
-                    processed_action = ZoomTransformerHelper.process_ivr_payload(action, job_group_id)
-                    processed_actions.append(processed_action)
+                # Drop null entries rather than sending them to Zoom as key actions
+                process = ZoomTransformerHelper.process_ivr_payload
+                processed_actions = [
+                    processed_action for action in actions
+                    if (processed_action := process(action, job_group_id)) is not None
+                ]
                 payload['key_actions'] = processed_actions
-                logger.info(f"ENHANCED_PAYLOAD: Processed {len(processed_actions)} IVR actions")
+                logger.info("ENHANCED_PAYLOAD: Processed %s IVR actions", len(processed_actions))
         
         # Process audio prompt
         if 'prompt' in record_data:
@@ -724,9 +928,9 @@ class ZoomTransformerHelper:
             hours_data = record_data.get('schedule') or record_data.get('hours')
             hours_type = ZoomTransformerHelper.process_hours_type_mapping(hours_data)
             payload['hours_type'] = hours_type
-            logger.info(f"ENHANCED_PAYLOAD: Set hours_type to {hours_type}")
+            logger.info("ENHANCED_PAYLOAD: Set hours_type to %s", hours_type)
         
-        logger.info(f"ENHANCED_PAYLOAD: Built complete payload with {len(payload)} components")
+        logger.info("ENHANCED_PAYLOAD: Built complete payload with %s components", len(payload))
         return payload
     
     # === SITES TRANSFORMATION METHODS ===
@@ -755,33 +959,10 @@ class ZoomTransformerHelper:
             "Site" -> "Site (NIU)" (10 chars)
         """
         if not site_name or not isinstance(site_name, str):
-            logger.warning(f"Invalid site_name provided: {site_name}")
+            logger.warning("Invalid site_name provided: %s", site_name)
             return "Unknown (NIU)"[:max_length]
         
-        # Clean and normalize the site name
-        clean_name = site_name.strip()
-        suffix = " (NIU)"  # Abbreviated form of "(NOT IN USE)"
-        
-        # If the full name + suffix fits, use it
-        full_name = clean_name + suffix
-        if len(full_name) <= max_length:
-            logger.info(f"AR name fits within limit: '{full_name}' ({len(full_name)} chars)")
-            return full_name
-        
-        # Calculate available space for the base name
-        available_for_base = max_length - len(suffix)
-        
-        if available_for_base > 0:
-            # Truncate base name to fit with suffix
-            truncated_base = clean_name[:available_for_base].rstrip()
-            result = truncated_base + suffix
-            logger.info(f"AR name truncated to fit: '{site_name}' -> '{result}' ({len(result)} chars)")
-            return result
-        else:
-            # Suffix itself is too long for the limit (shouldn't happen with 30 char limit)
-            result = suffix[:max_length]
-            logger.warning(f"Suffix too long for limit, using: '{result}' ({len(result)} chars)")
-            return result
+        return _auto_receptionist_name(site_name, max_length)
     
     @staticmethod
     def apply_sites_transformation(record: Dict[str, Any], transform_config: Dict[str, Any]) -> Any:
@@ -828,12 +1009,12 @@ class ZoomTransformerHelper:
                     
                     if len(result) > max_length:
                         result = result[:max_length].rstrip()
-                        logger.info(f"Template result truncated to {max_length} chars: '{result}'")
+                        logger.info("Template result truncated to %s chars: '%s'", max_length, result)
                     
                     return result
         
         # Fallback for unknown transformation types
-        logger.warning(f"Unknown sites transformation type: {transform_type}")
+        logger.warning("Unknown sites transformation type: %s", transform_type)
         return record.get(transform_config.get('source', 'name'), '')
     
     @staticmethod
@@ -906,11 +1087,14 @@ class ZoomTransformerHelper:
     # Migrated from TimezoneConverter for timezone transformations
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def convert_to_iana_timezone(rc_timezone: str) -> str:
         """
         Convert RingCentral timezone format to IANA timezone format.
         
         Migrated from TimezoneConverter.convert_to_iana_timezone() for timezone transformation.
+        Memoized: inputs come from a small set of RingCentral names, and only the
+        first lookup of each one is logged.
         
         Args:
             rc_timezone: RingCentral timezone string or existing IANA timezone
@@ -923,46 +1107,24 @@ class ZoomTransformerHelper:
             return 'America/Los_Angeles'
 
         # Check if it's already in IANA format (e.g., America/New_York)
-        if '/' in rc_timezone and (
-            rc_timezone.startswith('America/') or 
-            rc_timezone.startswith('Europe/') or 
-            rc_timezone.startswith('Asia/') or 
-            rc_timezone.startswith('Pacific/') or
-            rc_timezone == 'UTC'
-        ):
+        if _is_iana_name(rc_timezone):
             return rc_timezone
 
         # Direct mapping lookup for RingCentral formats
-        if rc_timezone in ZoomTransformerHelper.RC_TO_IANA_MAPPING:
-            iana_timezone = ZoomTransformerHelper.RC_TO_IANA_MAPPING[rc_timezone]
-            logger.info(f"Converted timezone: {rc_timezone} → {iana_timezone}")
+        iana_timezone = _RC_TO_IANA_MAPPING.get(rc_timezone)
+        if iana_timezone is not None:
+            logger.info("Converted timezone: %s → %s", rc_timezone, iana_timezone)
             return iana_timezone
         
-        # Fallback: try to parse common patterns
-        rc_lower = rc_timezone.lower().strip()
-        
-        # Check for Pacific variations
-        if 'pacific' in rc_lower:
-            logger.info(f"Pacific timezone detected: {rc_timezone} → America/Los_Angeles")
-            return 'America/Los_Angeles'
-        
-        # Check for Mountain variations
-        elif 'mountain' in rc_lower:
-            logger.info(f"Mountain timezone detected: {rc_timezone} → America/Denver")
-            return 'America/Denver'
-        
-        # Check for Central variations  
-        elif 'central' in rc_lower:
-            logger.info(f"Central timezone detected: {rc_timezone} → America/Chicago")
-            return 'America/Chicago'
-        
-        # Check for Eastern variations
-        elif 'eastern' in rc_lower:
-            logger.info(f"Eastern timezone detected: {rc_timezone} → America/New_York")
-            return 'America/New_York'
+        # Fallback: try to parse common patterns (first match wins)
+        rc_lower = rc_timezone.lower()
+        for needle, iana_timezone in _FALLBACK_PATTERNS:
+            if needle in rc_lower:
+                logger.info("%s timezone detected: %s → %s", needle.capitalize(), rc_timezone, iana_timezone)
+                return iana_timezone
         
         # Default fallback
-        logger.warning(f"Unknown timezone format: {rc_timezone}, defaulting to America/Los_Angeles")
+        logger.warning("Unknown timezone format: %s, defaulting to America/Los_Angeles", rc_timezone)
         return 'America/Los_Angeles'
     
     # === VALIDATION TRANSFORMATION METHODS ===
@@ -1014,37 +1176,37 @@ class ZoomTransformerHelper:
         Returns:
             Formatted extension string
         """
-        logger.debug(f"EXTENSION_DEBUG: Input value='{value}' (type: {type(value)}), config={config}")
+        logger.debug("EXTENSION_DEBUG: Input value='%s' (type: %s), config=%s", value, type(value), config)
         
         if value is None:
-            logger.debug(f"EXTENSION_DEBUG: Value is None, returning as-is")
+            logger.debug("EXTENSION_DEBUG: Value is None, returning as-is")
             return value
         
         str_value = str(value).strip()
         prefix = config.get('prefix', '10')
         min_length = config.get('min_length', 3)
         
-        logger.debug(f"EXTENSION_DEBUG: str_value='{str_value}', prefix='{prefix}', min_length={min_length}")
+        logger.debug("EXTENSION_DEBUG: str_value='%s', prefix='%s', min_length=%s", str_value, prefix, min_length)
         
         # If already long enough, return as-is
         if len(str_value) >= min_length:
-            logger.debug(f"EXTENSION_DEBUG: Value '{str_value}' already meets min_length {min_length}, returning as-is")
+            logger.debug("EXTENSION_DEBUG: Value '%s' already meets min_length %s, returning as-is", str_value, min_length)
             return str_value
         
         # For single digits, prepend prefix (e.g., 2 -> 102, 3 -> 103)
         if len(str_value) == 1 and str_value.isdigit():
             result = prefix + str_value
-            logger.info(f"EXTENSION_DEBUG: Single digit transformation: '{str_value}' → '{result}' (prefix: '{prefix}')")
+            logger.info("EXTENSION_DEBUG: Single digit transformation: '%s' → '%s' (prefix: '%s')", str_value, result, prefix)
             return result
         
         # For two digits, just prepend one digit from prefix
         elif len(str_value) == 2 and str_value.isdigit():
             result = prefix[0] + str_value
-            logger.info(f"EXTENSION_DEBUG: Two digit transformation: '{str_value}' → '{result}' (prefix[0]: '{prefix[0]}')")
+            logger.info("EXTENSION_DEBUG: Two digit transformation: '%s' → '%s' (prefix[0]: '%s')", str_value, result, prefix[0])
             return result
         
         # Fallback: just return the original value
-        logger.warning(f"EXTENSION_DEBUG: Could not transform '{str_value}' (len={len(str_value)}, isdigit={str_value.isdigit()}), returning as-is")
+        logger.warning("EXTENSION_DEBUG: Could not transform '%s' (len=%s, isdigit=%s), returning as-is", str_value, len(str_value), str_value.isdigit())
         return str_value
     
     @staticmethod
@@ -1061,26 +1223,24 @@ class ZoomTransformerHelper:
         Returns:
             Extracted field value or None if not found
         """
-        logger.debug(f"EXTRACT_NESTED: Extracting '{field_path}' from record")
+        logger.debug("EXTRACT_NESTED: Extracting '%s' from record", field_path)
         
         if not field_path:
-            logger.warning(f"EXTRACT_NESTED: Empty field path provided")
+            logger.warning("EXTRACT_NESTED: Empty field path provided")
             return None
         
-        # Split the path by dots
-        path_parts = field_path.split('.')
         current_value = record
         
         try:
-            for part in path_parts:
+            for part in _split_path(field_path):
                 if isinstance(current_value, dict) and part in current_value:
                     current_value = current_value[part]
-                    logger.debug(f"EXTRACT_NESTED: Found '{part}' = {current_value}")
+                    logger.debug("EXTRACT_NESTED: Found '%s' = %s", part, current_value)
                 else:
-                    logger.warning(f"EXTRACT_NESTED: Could not find '{part}' in {type(current_value)} {current_value}")
+                    logger.warning("EXTRACT_NESTED: Could not find '%s' in %s %s", part, type(current_value), current_value)
                     return None
             
-            logger.info(f"EXTRACT_NESTED: Successfully extracted '{field_path}' = {current_value}")
+            logger.info("EXTRACT_NESTED: Successfully extracted '%s' = %s", field_path, current_value)
             return current_value
             
         except Exception as e:
@@ -1107,40 +1267,23 @@ class ZoomTransformerHelper:
         # Extract content between parentheses
         content = transformation[7:-1]  # Remove "concat(" and ")"
         
-        # Parse arguments (simple CSV parsing)
+        # Parse arguments; quotes are dropped and the quoted text becomes the argument
         args = []
-        current_arg = ""
-        in_quotes = False
-        
-        for char in content:
-            if char == '"' and not in_quotes:
-                in_quotes = True
-            elif char == '"' and in_quotes:
-                in_quotes = False
-                args.append(current_arg)
-                current_arg = ""
-            elif char == ',' and not in_quotes:
-                if current_arg.strip():
-                    args.append(current_arg.strip())
-                current_arg = ""
+        for prefix, quoted, closed, bare in _CONCAT_ARG_RE.findall(content):
+            if closed:
+                args.append(prefix + quoted)
             else:
-                current_arg += char
-        
-        # Add the last argument
-        if current_arg.strip():
-            args.append(current_arg.strip())
+                arg = (bare or prefix + quoted).strip()
+                if arg:
+                    args.append(arg)
         
-        # Build concatenated result
+        # Build concatenated result; every argument, quoted or not, is resolved as a field path
+        get_field = ZoomTransformerHelper.get_nested_field
         result_parts = []
         for arg in args:
-            if arg.startswith('"') and arg.endswith('"'):
-                # String literal
-                result_parts.append(arg[1:-1])
-            else:
-                # Field reference
-                value = ZoomTransformerHelper.get_nested_field(record, arg)
-                if value is not None:
-                    result_parts.append(str(value))
+            value = get_field(record, arg)
+            if value is not None:
+                result_parts.append(str(value))
         
         return ' '.join(result_parts)
     
@@ -1162,12 +1305,9 @@ class ZoomTransformerHelper:
         field_name = transformation[14:-1]  # Remove "map_user_type(" and ")"
         
         user_type = ZoomTransformerHelper.get_nested_field(record, field_name)
-        if user_type == 'User':
-            return 1
-        elif user_type == 'DigitalUser':
-            return 2
-        else:
+        if not isinstance(user_type, str):
             return 1  # Default to User
+        return _USER_TYPE_CODES.get(user_type, 1)
     
     @staticmethod
     def apply_phone_number_formatting(record: Dict[str, Any], transformation: str) -> List[Dict[str, str]]:
@@ -1207,66 +1347,8 @@ class ZoomTransformerHelper:
         Returns:
             Field value or None if not found
         """
-        try:
-            # First, check if the field_path exists as a literal key (for fields like 'zoomMapping.action')
-            if field_path in record:
-                logger.debug(f"Found literal field '{field_path}' with value: {record[field_path]}")
-                return record[field_path]
-            
-            # If not found as literal, try nested navigation with array support
-            value = record
-            path_parts = field_path.split('.')
-            
-            for part in path_parts:
-                # Check if this part contains array notation
-                if '[' in part and ']' in part:
-                    # Extract the key and array index/wildcard
-                    key_part = part[:part.index('[')]
-                    index_part = part[part.index('[') + 1:part.index(']')]
-                    
-                    # Navigate to the array
-                    if isinstance(value, dict) and key_part in value:
-                        array_value = value[key_part]
-                        logger.debug(f"Navigated to array '{key_part}', current value: {array_value}")
-                        
-                        if isinstance(array_value, list):
-                            if index_part == '*':
-                                # Return the entire array for wildcard
-                                value = array_value
-                                logger.debug(f"Returning entire array for wildcard: {len(array_value)} items")
-                            else:
-                                # Try to get specific index
-                                try:
-                                    index = int(index_part)
-                                    if 0 <= index < len(array_value):
-                                        value = array_value[index]
-                                        logger.debug(f"Navigated to array index [{index}], current value: {value}")
-                                    else:
-                                        logger.debug(f"Array index [{index}] out of bounds for array of length {len(array_value)}")
-                                        return None
-                                except ValueError:
-                                    logger.debug(f"Invalid array index '{index_part}' - not an integer")
-                                    return None
-                        else:
-                            logger.debug(f"Field '{key_part}' is not an array: {type(array_value)}")
-                            return None
-                    else:
-                        logger.debug(f"Cannot traverse '{key_part}' - current value is not a dict or key not found")
-                        return None
-                else:
-                    # Regular field navigation
-                    if isinstance(value, dict) and part in value:
-                        value = value[part]
-                        logger.debug(f"Navigated to '{part}', current value: {value}")
-                    else:
-                        logger.debug(f"Cannot traverse '{part}' - current value is not a dict: {type(value)}")
-                        return None
-            
-            logger.debug(f"Successfully resolved nested field path '{field_path}' to value: {value}")
-            return value
-        except Exception as e:
-            logger.error(f"Error resolving field path '{field_path}': {str(e)}")
-            return None
+        # Same semantics as ValidationService; paths are parsed once per distinct path
+        return _get_nested_field(record, field_path)
     
     @staticmethod
     def convert_country_to_iso(country_name: str) -> str:
@@ -1281,27 +1363,7 @@ class ZoomTransformerHelper:
         Returns:
             ISO country code
         """
-        # Country name to ISO code mapping
-        country_mapping = {
-            'United States': 'US',
-            'United States of America': 'US', 
-            'USA': 'US',
-            'US': 'US',
-            'Canada': 'CA',
-            'United Kingdom': 'GB',
-            'Great Britain': 'GB',
-            'UK': 'GB',
-            'Australia': 'AU',
-            'Germany': 'DE',
-            'France': 'FR',
-            'Japan': 'JP',
-            'China': 'CN',
-            'India': 'IN',
-            'Brazil': 'BR',
-            'Mexico': 'MX'
-        }
-        
-        return country_mapping.get(country_name, country_name)
+        return _COUNTRY_TO_ISO.get(country_name, country_name)
     
     @staticmethod
     def normalize_address_field(value: str) -> str:
@@ -1322,43 +1384,9 @@ class ZoomTransformerHelper:
         # First apply title case
         normalized = value.title()
         
-        # Handle common abbreviations and special cases
-        replacements = {
-            ' Po ': ' PO ',      # PO Box
-            ' Ne ': ' NE ',      # Northeast
-            ' Nw ': ' NW ',      # Northwest
-            ' Se ': ' SE ',      # Southeast
-            ' Sw ': ' SW ',      # Southwest
-            ' Ct ': ' CT ',      # Court
-            ' St ': ' ST ',      # Street
-            ' Ave ': ' AVE ',    # Avenue
-            ' Blvd ': ' BLVD ',  # Boulevard
-            ' Dr ': ' DR ',      # Drive
-            ' Ln ': ' LN ',      # Lane
-            ' Rd ': ' RD ',      # Road
-            ' Apt ': ' APT ',    # Apartment
-            ' Ste ': ' STE ',    # Suite
-        }
-        
-        for old, new in replacements.items():
-            normalized = normalized.replace(old, new)
-        
-        # Handle cases at the end of string
-        end_replacements = {
-            ' Ct': ' CT',
-            ' St': ' ST',
-            ' Ave': ' AVE',
-            ' Blvd': ' BLVD',
-            ' Dr': ' DR',
-            ' Ln': ' LN',
-            ' Rd': ' RD',
-        }
-        
-        for old, new in end_replacements.items():
-            if normalized.endswith(old):
-                normalized = normalized[:-len(old)] + new
-        
-        return normalized
+        # Handle common abbreviations and special cases, then cases at the end of string
+        normalized = _ADDRESS_MID_RE.sub(_upper_address_token, normalized)
+        return _ADDRESS_END_RE.sub(_upper_address_token, normalized)
     
     @staticmethod
     def apply_timezone_conversion(record: Dict[str, Any], transformation: str) -> str:
@@ -1410,21 +1438,21 @@ class ZoomTransformerHelper:
                 array_value = ZoomTransformerHelper.get_nested_field(record, base_path)
                 
                 if isinstance(array_value, list):
-                    results = []
-                    for item in array_value:
-                        if remaining_path:
-                            # Navigate further into each array item
-                            item_value = ZoomTransformerHelper.get_nested_field(item, remaining_path)
-                            # CRITICAL: Always append to preserve array indices, even for null values
-                            results.append(item_value)
-                        else:
-                            # Return the item itself if no remaining path
-                            results.append(item)
+                    if remaining_path:
+                        # Navigate further into each array item
+                        # CRITICAL: Always keep one entry per item to preserve array indices, even for null values
+                        walk, parsed = _path_walker(remaining_path)
+                        results = [
+                            _resolve_field(item, remaining_path, walk, parsed) for item in array_value
+                        ]
+                    else:
+                        # Return the items themselves if no remaining path
+                        results = list(array_value)
                     
-                    logger.debug(f"Multi-lookup for '{field_path}' returned {len(results)} results")
+                    logger.debug("Multi-lookup for '%s' returned %s results", field_path, len(results))
                     return results
                 else:
-                    logger.debug(f"Base path '{base_path}' is not an array: {type(array_value)}")
+                    logger.debug("Base path '%s' is not an array: %s", base_path, type(array_value))
                     return []
             else:
                 # Regular single field lookup
@@ -1478,7 +1506,7 @@ class ZoomTransformerHelper:
                 self.logger.error(f"Error transforming site record {record.get('id', 'unknown')}: {str(e)}")
                 continue
         
-        self.logger.info(f"Transformed {len(transformed_records)} site records")
+        self.logger.info("Transformed %s site records", len(transformed_records))
         return transformed_records
     
     def _transform_regional_settings(self, regional_settings: Dict[str, Any]) -> Dict[str, Any]:
@@ -1560,32 +1588,11 @@ class ZoomTransformerHelper:
         Returns:
             Zoom user type integer (1=User, 2=DigitalUser, 99=Other)
         """
-        user_type_mapping = {
-            'User': 1,
-            'DigitalUser': 2,
-            'FlexibleUser': 1,  # Map to regular user
-            'FaxUser': 99,
-            'VirtualUser': 99,
-            'Department': 99,
-            'Announcement': 99,
-            'Voicemail': 99,
-            'SharedLinesGroup': 99,
-            'PagingOnly': 99,
-            'IvrMenu': 99,
-            'ApplicationExtension': 99,
-            'ParkLocation': 99,
-            'Limited': 99,
-            'Bot': 99,
-            'ProxyAdmin': 99,
-            'DelegatedLinesGroup': 99,
-            'Site': 99
-        }
-
-        zoom_type = user_type_mapping.get(rc_user_type, 99)
+        zoom_type = ZOOM_TYPE_MAP.get(rc_user_type, 99)
         if zoom_type == 99 and rc_user_type:
-            logger.warning(f"Unknown RingCentral user type '{rc_user_type}', mapping to 99 (Other)")
+            logger.warning("Unknown RingCentral user type '%s', mapping to 99 (Other)", rc_user_type)
         else:
-            logger.info(f"Mapped RingCentral user type '{rc_user_type}' → Zoom type {zoom_type}")
+            logger.info("Mapped RingCentral user type '%s' → Zoom type %s", rc_user_type, zoom_type)
 
         return zoom_type
 
@@ -1616,7 +1623,7 @@ class ZoomTransformerHelper:
         else:
             display_name = ""
 
-        logger.info(f"Generated display name: '{display_name}' from '{first_name}' + '{last_name}'")
+        logger.info("Generated display name: '%s' from '%s' + '%s'", display_name, first_name, last_name)
         return display_name
 
     @staticmethod
@@ -1633,21 +1640,21 @@ class ZoomTransformerHelper:
             List of formatted phone number objects for Zoom
         """
         if not isinstance(phone_numbers, list):
-            logger.warning(f"phone_numbers is not a list: {type(phone_numbers)}")
+            logger.warning("phone_numbers is not a list: %s", type(phone_numbers))
             return []
 
         formatted_numbers = []
 
         for phone_obj in phone_numbers:
             if not isinstance(phone_obj, dict):
-                logger.warning(f"Skipping invalid phone object: {phone_obj}")
+                logger.warning("Skipping invalid phone object: %s", phone_obj)
                 continue
 
             phone_type = phone_obj.get('type', '').lower()
             phone_number = phone_obj.get('number', '')
 
             if not phone_number:
-                logger.debug(f"Skipping phone object without number: {phone_obj}")
+                logger.debug("Skipping phone object without number: %s", phone_obj)
                 continue
 
             # Map RingCentral phone types to Zoom format
@@ -1667,9 +1674,9 @@ class ZoomTransformerHelper:
             }
 
             formatted_numbers.append(formatted_phone)
-            logger.debug(f"Formatted phone: {phone_type} → {zoom_type}, number: {phone_number}")
+            logger.debug("Formatted phone: %s → %s, number: %s", phone_type, zoom_type, phone_number)
 
-        logger.info(f"Formatted {len(formatted_numbers)} phone numbers")
+        logger.info("Formatted %s phone numbers", len(formatted_numbers))
         return formatted_numbers
 
     @staticmethod
@@ -1702,7 +1709,7 @@ class ZoomTransformerHelper:
                 return timezone_mapping[timezone_str]
             
             # Fallback to Eastern timezone
-            logger.warning(f"Unknown timezone '{timezone_str}', using fallback Eastern timezone")
+            logger.warning("Unknown timezone '%s', using fallback Eastern timezone", timezone_str)
             return '58'  # Eastern
             
         except Exception as e:
@@ -0,0 +1,67 @@
+"""
+Unit tests for the SitesToZoomTransformer.
+
+These run without a database: the SSOT schema and transformation config are patched.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from app.transformers.base_transformer import BaseTransformer
+from app.transformers.ssot_to_zoom.sites_transformer import SitesToZoomTransformer
+
+
+class TestSitesToZoomTransformer(unittest.TestCase):
+    """Test cases for the SitesToZoomTransformer class."""
+
+    def _make_transformer(self, ssot_schema):
+        with patch.object(BaseTransformer, "get_ssot_schema", return_value=ssot_schema), \
+                patch.object(BaseTransformer, "get_transformation_config", return_value={}):
+            return SitesToZoomTransformer()
+
+    def test_transform_with_partial_field_mappings_keeps_record(self):
+        """Schema field mappings do not narrow the output to the mapped keys."""
+        transformer = self._make_transformer({"field_mappings": {"name": "site_name"}})
+        site = {
+            "name": "HQ",
+            "address_line1": "1 Main",
+            "city": "Springfield",
+            "state": "CA",
+            "country": "US",
+            "extra": 1,
+            "businessAddress": {
+                "street": "1 Main",
+                "city": "Springfield",
+                "state": "CA",
+                "zip": "90001",
+                "country": "United States",
+            },
+            "regionalSettings": {"timezone": "Pacific Standard Time", "lang": "en"},
+        }
+
+        result = transformer.transform(site)
+
+        self.assertEqual(result, {
+            "name": "HQ",
+            "address_line1": "1 Main",
+            "city": "Springfield",
+            "state": "CA",
+            "country": "US",
+            "extra": 1,
+            "regionalSettings": {"timezone": "America/Los_Angeles", "lang": "en"},
+            "default_emergency_address": {
+                "address_line1": "1 Main",
+                "city": "Springfield",
+                "state_code": "CA",
+                "zip": "90001",
+                "country": "US",
+            },
+            "auto_receptionist_name": "HQ (NIU)",
+            "status": "active",
+        })
+        self.assertIn("businessAddress", site)
+        self.assertEqual(site["regionalSettings"]["timezone"], "Pacific Standard Time")
+
+
+if __name__ == "__main__":
+    unittest.main()
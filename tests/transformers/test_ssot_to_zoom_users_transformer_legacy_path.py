@@ -0,0 +1,62 @@
+"""
+Unit tests for the legacy (no field mappings) path of SSOTToZoomUsersTransformer.transform.
+
+These run without a database: schema, config and field mappings are patched
+so the transformer takes its legacy path.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from app.services.field_mapping_service import FieldMappingService
+from app.transformers.base_transformer import BaseTransformer
+from app.transformers.ssot_to_zoom.users_transformer import SSOTToZoomUsersTransformer
+
+
+class TestSSOTToZoomUsersTransformerLegacyPath(unittest.TestCase):
+    """Test cases for the legacy transform path."""
+
+    def setUp(self):
+        """Build a transformer with no schema, config or field mappings."""
+        with patch.object(BaseTransformer, "get_ssot_schema", return_value={}), \
+                patch.object(BaseTransformer, "get_transformation_config", return_value={}), \
+                patch.object(FieldMappingService, "get_cached_field_mappings", return_value=[]):
+            self.transformer = SSOTToZoomUsersTransformer()
+
+    def test_transform_keeps_all_input_keys(self):
+        """The legacy path copies the whole record, not just Zoom-relevant keys."""
+        ssot_user = {
+            "id": "1",
+            "email": "e@example.com",
+            "firstName": "Ann",
+            "last_name": "Lee",
+            "role": "admin",
+            "site_id": "s9",
+            "timezone": "America/Chicago",
+            "extension_number": "101",
+        }
+
+        result = self.transformer.transform(ssot_user)
+
+        self.assertEqual(result, {
+            **ssot_user,
+            "user_info": {
+                "first_name": "Ann",
+                "last_name": "Lee",
+                "email": "e@example.com",
+                "phone_number": "",
+                "type": 1,
+            },
+            "display_name": "Ann Lee",
+            "status": "active",
+        })
+        self.assertNotIn("user_info", ssot_user)
+
+    def test_transform_rejects_missing_required_output(self):
+        """A user without first/last name fails output validation."""
+        with self.assertRaises(ValueError):
+            self.transformer.transform({"id": "1", "email": "e@example.com"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Unit tests for FieldMappingService.
+
+These run without a database: lookups go through patched get_db/get_field_mappings.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.services import field_mapping_service
+from app.services.field_mapping_service import FieldMappingService
+
+
+MAPPINGS = [
+    {"ssot_field": "firstName", "target_field": "first_name", "transformation_rule": "capitalize"},
+    {"ssot_field": "email", "target_field": "email", "transformation_rule": "lowercase", "is_required": True},
+    {"ssot_field": "ext", "target_field": "extension", "transformation_rule": "integer"},
+    {"ssot_field": "active", "target_field": "enabled", "transformation_rule": "boolean"},
+    {"ssot_field": "site", "target_field": "site_id", "transformation_rule": None},
+    {"ssot_field": "phone", "target_field": "phone_number", "is_required": True},
+    {"ssot_field": "it's", "target_field": "quoted\nkey"},
+]
+
+
+class TestCompileFieldMappings(unittest.TestCase):
+    """compile_field_mappings matches apply_field_mappings."""
+
+    RECORDS = [
+        {"firstName": "ann", "email": "Ann@Example.COM", "ext": "101", "active": 0, "site": "s1",
+         "phone": "+1555", "it's": 1, "other": "dropped"},
+        {"firstName": None, "email": None, "ext": "abc", "site": None},
+        {"ext": "", "active": "yes"},
+        {"unmapped": True},
+        {},
+    ]
+
+    def test_matches_apply_field_mappings(self):
+        apply = FieldMappingService.compile_field_mappings(MAPPINGS)
+        for record in self.RECORDS:
+            self.assertEqual(apply(record), FieldMappingService.apply_field_mappings(record, MAPPINGS))
+
+    def test_output(self):
+        apply = FieldMappingService.compile_field_mappings(MAPPINGS)
+
+        self.assertEqual(apply(self.RECORDS[0]), {
+            "first_name": "Ann",
+            "email": "ann@example.com",
+            "extension": 101,
+            "enabled": False,
+            "site_id": "s1",
+            "phone_number": "+1555",
+            "quoted\nkey": 1,
+        })
+        # A failing rule keeps the original value; None skips the rule
+        self.assertEqual(apply(self.RECORDS[1]), {"first_name": None, "email": None, "extension": "abc", "site_id": None})
+        self.assertEqual(apply({}), {})
+
+    def test_missing_required_fields_are_logged(self):
+        apply = FieldMappingService.compile_field_mappings(MAPPINGS)
+
+        with self.assertLogs(field_mapping_service.logger, "WARNING") as logs:
+            apply({"ext": "1"})
+
+        self.assertEqual(logs.output, [f"WARNING:{field_mapping_service.logger.name}:Missing required fields in data: email, phone"])
+
+    def test_no_mappings_returns_input(self):
+        record = {"a": 1}
+        self.assertIs(FieldMappingService.compile_field_mappings([])(record), record)
+
+
+class TestGetCachedFieldMappings(unittest.TestCase):
+    """Test cases for get_cached_field_mappings."""
+
+    def setUp(self):
+        FieldMappingService.clear_field_mappings_cache()
+        self.addCleanup(FieldMappingService.clear_field_mappings_cache)
+        self.db = MagicMock()
+        patcher = patch.object(field_mapping_service, "get_db", side_effect=lambda: iter([self.db]))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_non_empty_lookup_is_cached(self):
+        with patch.object(FieldMappingService, "get_field_mappings", return_value=MAPPINGS) as lookup:
+            first = FieldMappingService.get_cached_field_mappings(1, "ssot", "user")
+            second = FieldMappingService.get_cached_field_mappings(1, "ssot", "user")
+
+        self.assertEqual(first, MAPPINGS)
+        self.assertIs(second, first)
+        lookup.assert_called_once_with(1, "ssot", "user", db=self.db)
+        self.db.close.assert_called_once_with()
+
+    def test_keys_are_separate(self):
+        with patch.object(FieldMappingService, "get_field_mappings", return_value=MAPPINGS) as lookup:
+            FieldMappingService.get_cached_field_mappings(1, "ssot", "user")
+            FieldMappingService.get_cached_field_mappings(1, "ssot", "site")
+
+        self.assertEqual(lookup.call_count, 2)
+
+    def test_empty_lookup_is_retried(self):
+        with patch.object(FieldMappingService, "get_field_mappings", return_value=[]) as lookup:
+            self.assertEqual(FieldMappingService.get_cached_field_mappings(1, "ssot", "user"), [])
+            FieldMappingService.get_cached_field_mappings(1, "ssot", "user")
+
+        self.assertEqual(lookup.call_count, 2)
+
+    def test_clear_drops_cached_mappings(self):
+        with patch.object(FieldMappingService, "get_field_mappings", return_value=MAPPINGS) as lookup:
+            FieldMappingService.get_cached_field_mappings(1, "ssot", "user")
+            FieldMappingService.clear_field_mappings_cache()
+            FieldMappingService.get_cached_field_mappings(1, "ssot", "user")
+
+        self.assertEqual(lookup.call_count, 2)
+
+
+class TestApplyNestedFieldMappings(unittest.TestCase):
+    """Test cases for apply_nested_field_mappings and apply_nested_field_mappings_into."""
+
+    MAPPINGS = [
+        {"ssot_field": "firstName", "target_field": "user_info.first_name"},
+        {"ssot_field": "email", "target_field": "user_info.email"},
+        {"ssot_field": "site", "target_field": "site_id"},
+        {"ssot_field": "city", "target_field": "address.city"},
+    ]
+
+    def test_nested_output(self):
+        data = {"firstName": "Ann", "email": "a@example.com", "site": "s1", "city": "Paris"}
+
+        result = FieldMappingService.apply_nested_field_mappings(data, self.MAPPINGS, "user_info")
+
+        self.assertEqual(result, {"site_id": "s1", "user_info": {"first_name": "Ann", "email": "a@example.com"}})
+
+    def test_parent_only_created_when_fields_present(self):
+        result = FieldMappingService.apply_nested_field_mappings({"site": "s1"}, self.MAPPINGS, "user_info")
+
+        self.assertEqual(result, {"site_id": "s1"})
+
+    def test_into_extends_existing_target(self):
+        target = {"status": "active", "user_info": {"type": 1}}
+
+        result = FieldMappingService.apply_nested_field_mappings_into(
+            {"firstName": "Ann", "site": "s1"}, self.MAPPINGS, "user_info", target
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(target, {"status": "active", "site_id": "s1", "user_info": {"type": 1, "first_name": "Ann"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
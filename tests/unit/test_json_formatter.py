@@ -0,0 +1,143 @@
+"""
+Unit tests for the JSON log formatter and handlers.
+"""
+
+import io
+import json
+import logging
+import sys
+import unittest
+
+from app.utils.json_formatter import (
+    JSONBytesHandler,
+    JSONFormatter,
+    configure_async_json_logging,
+)
+
+
+def make_record(msg="hello %s", args=("world",), exc_info=None, **extra):
+    record = logging.LogRecord("test.logger", logging.INFO, __file__, 10, msg, args, exc_info, func="fn")
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJSONFormatter(unittest.TestCase):
+    """Test cases for JSONFormatter."""
+
+    def setUp(self):
+        self.formatter = JSONFormatter()
+
+    def test_format_fields(self):
+        """Standard fields, context defaults and extras are emitted."""
+        data = json.loads(self.formatter.format(make_record(user_id=123, service="gateway")))
+
+        self.assertTrue(data["timestamp"].endswith("Z"))
+        self.assertEqual(data["message"], "hello world")
+        self.assertEqual(data["level"], "INFO")
+        self.assertEqual(data["logger"], "test.logger")
+        self.assertEqual(data["function"], "fn")
+        self.assertEqual(data["line"], 10)
+        self.assertEqual(data["service"], "gateway")
+        self.assertEqual(data["platform"], "unknown")
+        self.assertEqual(data["user_id"], 123)
+        self.assertNotIn("args", data)
+
+    def test_format_bytes_matches_format(self):
+        """format() is the decoded format_bytes() output."""
+        record = make_record(ip="192.168.1.1")
+        from_bytes = json.loads(self.formatter.format_bytes(record))
+        from_str = json.loads(self.formatter.format(record))
+
+        from_bytes.pop("timestamp")
+        from_str.pop("timestamp")
+        self.assertEqual(from_bytes, from_str)
+        self.assertEqual(from_str["ip"], "192.168.1.1")
+
+    def test_unserializable_extra_becomes_string(self):
+        data = json.loads(self.formatter.format(make_record(obj={1, 2})))
+        self.assertEqual(data["obj"], str({1, 2}))
+
+    def test_lone_surrogate_falls_back(self):
+        """orjson rejects lone surrogates; the record is still formatted."""
+        data = json.loads(self.formatter.format(make_record("bad \udcff name", None, tag="x\ud800")))
+
+        self.assertEqual(data["message"], "bad \udcff name")
+        self.assertEqual(data["tag"], "x\ud800")
+        self.assertTrue(data["timestamp"].endswith("Z"))
+
+    def test_wide_integers_stay_numbers(self):
+        data = json.loads(self.formatter.format(make_record(big=2 ** 70, small=-2 ** 63)))
+
+        self.assertEqual(data["big"], 2 ** 70)
+        self.assertEqual(data["small"], -2 ** 63)
+
+    def test_exception_info(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+
+        data = json.loads(self.formatter.format(record))
+
+        self.assertEqual(data["exception"]["type"], "ValueError")
+        self.assertEqual(data["exception"]["message"], "boom")
+        self.assertIn("ValueError: boom", data["exception"]["traceback"])
+
+
+class TestJSONBytesHandler(unittest.TestCase):
+    """Test cases for JSONBytesHandler."""
+
+    def test_writes_to_binary_buffer(self):
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        handler = JSONBytesHandler(stream)
+
+        handler.emit(make_record())
+
+        line = raw.getvalue()
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(json.loads(line)["message"], "hello world")
+
+    def test_writes_text_without_buffer(self):
+        stream = io.StringIO()
+        handler = JSONBytesHandler(stream)
+
+        handler.emit(make_record())
+
+        self.assertEqual(json.loads(stream.getvalue())["message"], "hello world")
+
+
+class TestConfigureAsyncJsonLogging(unittest.TestCase):
+    """Test cases for configure_async_json_logging."""
+
+    def setUp(self):
+        root = logging.getLogger()
+        self.saved = (root.handlers[:], root.level)
+
+    def tearDown(self):
+        root = logging.getLogger()
+        root.handlers, level = self.saved
+        root.setLevel(level)
+
+    def test_records_reach_handler_as_json(self):
+        stream = io.StringIO()
+        listener = configure_async_json_logging(logging.INFO, logging.StreamHandler(stream))
+        try:
+            logger = logging.getLogger("test.async")
+            logger.debug("dropped")
+            logger.info("user %s", "ann", extra={"user_id": 1})
+            try:
+                raise KeyError("k")
+            except KeyError:
+                logger.exception("failed")
+        finally:
+            listener.stop()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line["message"] for line in lines], ["user ann", "failed"])
+        self.assertEqual(lines[0]["user_id"], 1)
+        self.assertEqual(lines[1]["exception"]["type"], "KeyError")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit tests for ProviderManager.
+
+These run without a Redis server: client calls are patched per manager.
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+
+from app.utils import provider_manager
+from app.utils.provider_manager import ProviderManager
+
+
+class TestGetAllProviders(unittest.TestCase):
+    """Test cases for the per-process provider names cache."""
+
+    def setUp(self):
+        provider_manager._providers_cache.clear()
+        self.addCleanup(provider_manager._providers_cache.clear)
+
+    def test_cached_per_tenant(self):
+        manager = ProviderManager("redis-a", 6379, 0)
+
+        with patch.object(manager.redis_client, "smembers", return_value={"zoom"}) as smembers:
+            self.assertEqual(manager.get_all_providers("t1"), ["zoom"])
+            self.assertEqual(manager.get_all_providers("t1"), ["zoom"])
+
+        smembers.assert_called_once_with("tenant:t1:providers")
+
+    def test_databases_do_not_share_entries(self):
+        db0 = ProviderManager("redis-a", 6379, 0)
+        db1 = ProviderManager("redis-a", 6379, 1)
+        other_host = ProviderManager("redis-b", 6379, 0)
+
+        with patch.object(db0.redis_client, "smembers", return_value={"zoom"}), \
+                patch.object(db1.redis_client, "smembers", return_value=set()), \
+                patch.object(other_host.redis_client, "smembers", return_value={"teams"}):
+            self.assertEqual(db0.get_all_providers("t1"), ["zoom"])
+            self.assertEqual(db1.get_all_providers("t1"), [])
+            self.assertEqual(other_host.get_all_providers("t1"), ["teams"])
+
+    def test_delete_drops_cached_names(self):
+        manager = ProviderManager("redis-a", 6379, 0)
+
+        with patch.object(manager.redis_client, "smembers", side_effect=[{"zoom"}, set()]), \
+                patch.object(manager.redis_client, "pipeline"):
+            manager.get_all_providers("t1")
+            manager.delete_provider("t1", "zoom")
+            self.assertEqual(manager.get_all_providers("t1"), [])
+
+
+class TestProviderJsonFields(unittest.TestCase):
+    """Provider JSON fields accept payloads json.dumps accepted."""
+
+    def setUp(self):
+        provider_manager._providers_cache.clear()
+        self.addCleanup(provider_manager._providers_cache.clear)
+        self.manager = ProviderManager("redis-a", 6379, 0)
+
+    def test_add_provider_non_str_keys(self):
+        with patch.object(self.manager.redis_client, "pipeline") as pipeline:
+            self.manager.add_provider("t1", "zoom", {"scopes": [{1: "read"}], "features_enabled": {2: True}})
+
+        stored = pipeline.return_value.__enter__.return_value.hset.call_args.kwargs["mapping"]
+        self.assertEqual(json.loads(stored["scopes"]), [{"1": "read"}])
+        self.assertEqual(json.loads(stored["features_enabled"]), {"2": True})
+
+    def test_update_provider_non_str_keys(self):
+        with patch.object(provider_manager, "_HSET_IF_EXISTS", return_value=1) as hset_if_exists:
+            self.assertTrue(self.manager.update_provider("t1", "zoom", {"scopes": {3: "write"}}))
+
+        args = hset_if_exists.call_args.kwargs["args"]
+        self.assertEqual(json.loads(args[args.index("scopes") + 1]), {"3": "write"})
+
+
+if __name__ == "__main__":
+    unittest.main()
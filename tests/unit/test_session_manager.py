@@ -0,0 +1,63 @@
+"""
+Unit tests for SessionManager.
+"""
+
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from app.utils.session_manager import SessionManager
+
+
+class TestGetSessionAndProvider(unittest.TestCase):
+    """Test cases for SessionManager.get_session_and_provider."""
+
+    def make_manager(self, session_hash, provider_hash):
+        redis_client = MagicMock()
+        pipe = redis_client.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [session_hash, provider_hash]
+        return SessionManager(redis_client), redis_client, pipe
+
+    def test_fetches_both_hashes_in_one_pipeline(self):
+        manager, redis_client, pipe = self.make_manager(
+            {"tenant": "t1", "system_creds": '{"id": 1}', "provider_tokens": '{"access_token": "abc"}'},
+            {"api_key": "k", "scopes": '["phone"]', "features_enabled": "[]", "sync_enabled": "False"},
+        )
+
+        session, provider = manager.get_session_and_provider("s1", "t1", "zoom")
+
+        redis_client.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(
+            [call.args for call in pipe.hgetall.call_args_list],
+            [("session:s1",), ("tenant:t1:provider:zoom",)],
+        )
+        pipe.execute.assert_called_once_with()
+        self.assertEqual(session, {"tenant": "t1", "system_creds": {"id": 1}, "provider_tokens": {"access_token": "abc"}})
+        self.assertEqual(provider, {"api_key": "k", "scopes": ["phone"], "features_enabled": [], "sync_enabled": False})
+
+    def test_missing_hashes_are_none(self):
+        manager, _, _ = self.make_manager({}, {})
+
+        self.assertEqual(manager.get_session_and_provider("s1", "t1", "zoom"), (None, None))
+
+
+class TestCreateSession(unittest.TestCase):
+    """Test cases for SessionManager.create_session."""
+
+    def test_non_str_keys_are_stored(self):
+        """Payloads with non-str dict keys encode as they did with json.dumps."""
+        redis_client = MagicMock()
+        pipe = redis_client.pipeline.return_value.__enter__.return_value
+
+        session = SessionManager(redis_client).create_session("t1", "app", {1: "x"}, {"access_token": "abc", 2: None})
+
+        session_key, = pipe.hset.call_args.args
+        stored = pipe.hset.call_args.kwargs["mapping"]
+        self.assertEqual(session_key, f"session:{session['session_id']}")
+        self.assertEqual(json.loads(stored["system_creds"]), {"1": "x"})
+        self.assertEqual(json.loads(stored["provider_tokens"]), {"access_token": "abc", "2": None})
+        pipe.expire.assert_called_once_with(session_key, 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the timezone converter utilities.
+"""
+
+import unittest
+
+from app.utils import timezone_converter
+from app.utils.zoom_transformer_ported import ZoomTransformerHelper
+
+
+class TestConvertToIanaTimezone(unittest.TestCase):
+    """Test cases for convert_to_iana_timezone."""
+
+    def test_names_resolve_through_either_table(self):
+        """RingCentral and common names both resolve."""
+        convert = timezone_converter.convert_to_iana_timezone
+        self.assertEqual(convert("Pacific Standard Time"), "America/Los_Angeles")
+        self.assertEqual(convert("EST"), "America/New_York")
+        self.assertEqual(convert("Hawaii Time"), "Pacific/Honolulu")
+        self.assertEqual(convert("GMT"), "UTC")
+
+    def test_iana_names_pass_through(self):
+        """Known and region-prefixed IANA names are returned unchanged."""
+        convert = timezone_converter.convert_to_iana_timezone
+        for name in ("UTC", "America/Phoenix", "Europe/Berlin", "Asia/Kolkata", "Australia/Perth"):
+            self.assertEqual(convert(name), name)
+
+    def test_fallbacks(self):
+        """Unmapped names use the substring heuristics, then the default."""
+        convert = timezone_converter.convert_to_iana_timezone
+        self.assertEqual(convert("US Mountain"), "America/Denver")
+        self.assertEqual(convert("Mars/Olympus"), "America/Los_Angeles")
+        self.assertEqual(convert(""), "America/Los_Angeles")
+
+
+class TestTransformTimezoneToIana(unittest.TestCase):
+    """Test cases for transform_timezone_to_iana."""
+
+    def test_strings(self):
+        transform = timezone_converter.transform_timezone_to_iana
+        self.assertEqual(transform("America/Chicago"), "America/Chicago")
+        self.assertEqual(transform("Australia/Sydney"), "Australia/Sydney")
+        self.assertEqual(transform("UTC"), "UTC")
+        self.assertEqual(transform("Central Time"), "America/Chicago")
+        self.assertIsNone(transform("UTC+5"))
+        self.assertIsNone(transform(None))
+
+    def test_objects(self):
+        transform = timezone_converter.transform_timezone_to_iana
+        self.assertEqual(transform({"id": 64}), "Pacific/Honolulu")
+        self.assertEqual(transform({"name": "EST"}), "America/New_York")
+        self.assertIsNone(transform({"id": "999"}))
+
+
+class TestHelperAgreesWithConverter(unittest.TestCase):
+    """ZoomTransformerHelper passes through the same IANA names as timezone_converter."""
+
+    NAMES = ("UTC", "America/New_York", "Europe/Paris", "Asia/Tokyo", "Australia/Sydney", "Australia/Perth")
+
+    def test_iana_names(self):
+        helper = ZoomTransformerHelper()
+        for name in self.NAMES:
+            self.assertEqual(helper.transform_timezone_to_iana(name), timezone_converter.transform_timezone_to_iana(name))
+            self.assertEqual(ZoomTransformerHelper.convert_to_iana_timezone(name), timezone_converter.convert_to_iana_timezone(name))
+            self.assertEqual(ZoomTransformerHelper.convert_to_iana_timezone(name), name)
+
+    def test_non_iana_strings(self):
+        helper = ZoomTransformerHelper()
+        for name in ("UTC+5", "Africa/Cairo"):
+            self.assertIsNone(helper.transform_timezone_to_iana(name))
+            self.assertIsNone(timezone_converter.transform_timezone_to_iana(name))
+
+
+class TestConvertTimezoneToRingcentralId(unittest.TestCase):
+    """Test cases for convert_timezone_to_ringcentral_id."""
+
+    def test_known_and_unknown_zones(self):
+        convert = timezone_converter.convert_timezone_to_ringcentral_id
+        self.assertEqual(convert("America/Chicago"), "59")
+        self.assertEqual(convert("Pacific/Honolulu"), "64")
+        self.assertEqual(convert("Europe/Paris"), "58")
+        self.assertEqual(convert(None), "58")
+
+    def test_unhashable_input_falls_back(self):
+        """Unhashable inputs log an error and fall back to Eastern instead of raising."""
+        with self.assertLogs(timezone_converter.logger, "ERROR"):
+            self.assertEqual(timezone_converter.convert_timezone_to_ringcentral_id(["x"]), "58")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for the validation utilities.
+"""
+
+import unittest
+
+from app.utils.validation import (
+    apply_validation_transformation,
+    apply_validation_transformation_batch,
+    compile_ruleset,
+    compile_validation_plan,
+)
+
+
+RULES = {
+    "transformations": {
+        "ext": {"type": "custom_extension_format", "prefix": "10", "min_length": 3},
+        "code": {"type": "minimum_length", "min_length": 4},
+        "name": {"type": "minimum_length", "minimum_length": 2, "pad_with": "_", "pad_direction": "right"},
+        "skip": {"type": "unknown"},
+    },
+    "validations": {
+        "name": {"type": "max_length", "max_length": 5, "truncate": True},
+        "desc": {"type": "max_length", "max_length": 3},
+        "code": {"type": "max_length", "max_length": 10},
+    },
+}
+
+ROWS = [
+    {"ext": "2", "code": "7", "name": "abcdefgh", "desc": "long", "skip": 1, "other": True},
+    {"ext": 42, "code": None, "name": "a", "desc": 12345},
+    {"ext": "1234", "desc": "ok"},
+    {"other": "untouched"},
+]
+
+
+class TestApplyValidationTransformation(unittest.TestCase):
+    """Test cases for apply_validation_transformation."""
+
+    def test_transforms_and_validates(self):
+        """Transformations run before max_length checks; the input is not modified."""
+        row = dict(ROWS[0])
+        result = apply_validation_transformation(row, RULES)
+
+        self.assertEqual(result, {
+            "data": {"ext": "102", "code": "0007", "name": "abcde", "desc": "long", "skip": 1, "other": True},
+            "validation_results": {
+                "name": {"valid": True, "truncated": True, "original_length": 8, "truncated_to": 5},
+                "desc": {
+                    "valid": False,
+                    "reason": "Value exceeds maximum length of 3 characters",
+                    "length": 4,
+                    "max_length": 3,
+                },
+            },
+        })
+        self.assertEqual(row, ROWS[0])
+
+    def test_non_string_values(self):
+        """None passes through transforms; non-strings are measured as str()."""
+        result = apply_validation_transformation(ROWS[1], RULES)
+
+        self.assertEqual(result["data"], {"ext": "142", "code": None, "name": "a_", "desc": 12345})
+        self.assertEqual(list(result["validation_results"]), ["desc"])
+        self.assertEqual(result["validation_results"]["desc"]["length"], 5)
+
+    def test_no_rules(self):
+        """Empty rules return an equal copy and no results."""
+        result = apply_validation_transformation(ROWS[0], {})
+
+        self.assertEqual(result, {"data": ROWS[0], "validation_results": {}})
+        self.assertIsNot(result["data"], ROWS[0])
+
+
+class TestCompiledValidation(unittest.TestCase):
+    """Compiled rulesets and batches match apply_validation_transformation."""
+
+    def setUp(self):
+        self.expected = [apply_validation_transformation(row, RULES) for row in ROWS]
+
+    def test_compile_ruleset_matches_direct(self):
+        validate = compile_ruleset(RULES)
+        for row, expected in zip(ROWS, self.expected):
+            result = validate(row)
+            self.assertEqual(result, expected)
+            self.assertEqual(list(result["validation_results"]), list(expected["validation_results"]))
+
+    def test_batch_matches_direct(self):
+        rows = [dict(row) for row in ROWS]
+        result = apply_validation_transformation_batch(rows, compile_validation_plan(RULES))
+
+        self.assertEqual(result, self.expected)
+        self.assertEqual(rows, ROWS)
+
+
+if __name__ == "__main__":
+    unittest.main()
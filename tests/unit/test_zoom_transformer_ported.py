@@ -0,0 +1,144 @@
+"""
+Unit tests for the ported ZoomTransformerHelper.
+"""
+
+import copy
+import unittest
+from unittest.mock import patch
+
+from app.utils.zoom_transformer_ported import ZoomTransformerHelper
+
+
+class TestTransformIvrActionsBatch(unittest.TestCase):
+    """Test cases for ZoomTransformerHelper.transform_ivr_actions_batch."""
+
+    ACTIONS = [
+        {"input": "Star", "action": "Connect", "extension": {"id": "101"}},
+        {"input": "1", "action": "Voicemail", "target": {"extension_id": "102"}},
+        {"key": "#", "action": 21, "target": {"extension_id": "101"}},
+        {"input": "2", "action": "Repeat"},
+        {"input": "3", "action": "Connect", "extension": {"id": ["unhashable"]}},
+    ]
+
+    def test_matches_single_action_transform(self):
+        """Each result equals transform_ivr_action() on the same action; invalid actions are dropped."""
+        for job_group_id in (None, 7):
+            expected = [
+                ZoomTransformerHelper.transform_ivr_action(action, job_group_id)
+                for action in self.ACTIONS
+            ]
+            result = ZoomTransformerHelper.transform_ivr_actions_batch(
+                self.ACTIONS + [None, "bad"], job_group_id
+            )
+            self.assertEqual(result, expected)
+
+        self.assertEqual(result[0], {"key": "*", "action": 2, "target": {"type": "user", "extension_id": "101"}})
+        self.assertEqual(result[2], {"key": "#", "action": 21})
+
+    def test_detects_each_extension_once(self):
+        """Extension types are looked up once per distinct id and applied to every action."""
+        with patch.object(
+            ZoomTransformerHelper, "get_extension_type_from_job_group", return_value="call_queue"
+        ) as detect:
+            result = ZoomTransformerHelper.transform_ivr_actions_batch(self.ACTIONS, job_group_id=7)
+
+        looked_up = [call.args[1] for call in detect.call_args_list]
+        self.assertEqual(looked_up, ["101", "102", ["unhashable"]])
+        self.assertEqual(result[0]["target"], {"type": "call_queue", "extension_id": "101"})
+        self.assertEqual(result[4]["target"], {"type": "call_queue", "extension_id": ["unhashable"]})
+
+
+class TestApplyConcatTransformation(unittest.TestCase):
+    """Test cases for ZoomTransformerHelper.apply_concat_transformation."""
+
+    RECORD = {"first": "John", "last": "Smith", "contact": {"email": "js@example.com"}, "ext": 0}
+
+    def concat(self, transformation):
+        return ZoomTransformerHelper.apply_concat_transformation(self.RECORD, transformation)
+
+    def test_fields_are_space_joined(self):
+        """Field-only concat matches the previous output: values joined by one space."""
+        self.assertEqual(self.concat("concat(first, last)"), "John Smith")
+        self.assertEqual(self.concat("concat( first ,, contact.email ,missing, ext)"), "John js@example.com 0")
+        self.assertEqual(self.concat("concat()"), "")
+
+    def test_quoted_arguments_keep_previous_output(self):
+        """Quoted arguments resolve as field paths, as before, so configured transforms keep their output."""
+        self.assertEqual(self.concat('concat(first, ",", last)'), "John Smith")
+        self.assertEqual(self.concat('concat(last, ", ", first)'), "Smith John")
+        self.assertEqual(self.concat('concat("Mr. ", last)'), "Smith")
+        self.assertEqual(self.concat('concat("", first)'), "John")
+        # Quoted text is kept unstripped, including whitespace before the quote
+        self.assertEqual(self.concat('concat("first", "contact.email")'), "John")
+        self.assertEqual(self.concat('concat(first,"last")'), "John Smith")
+
+
+class TestTransformUserData(unittest.TestCase):
+    """Test cases for ZoomTransformerHelper.transform_user_data and its batch form."""
+
+    USERS = [
+        {
+            "id": "1",
+            "type": "User",
+            "contact": {"firstName": "Ann", "lastName": "Lee", "email": "ann@example.com"},
+            "regionalSettings": {"id": "59"},
+        },
+        {"id": "2", "contact": {"businessPhone": "+15550100"}},
+        {"id": "3", "type": "", "user_info": {"email": "x@example.com"}},
+        {"name": "no id"},
+    ]
+
+    EXPECTED = [
+        {
+            "id": "1",
+            "type": "User",
+            "regionalSettings": {"id": "59"},
+            "user_info": {
+                "first_name": "Ann",
+                "last_name": "Lee",
+                "email": "ann@example.com",
+                "phone_number": "",
+                "timezone": "America/Chicago",
+                "type": "User",
+            },
+        },
+        {
+            "id": "2",
+            "user_info": {"first_name": "", "last_name": "", "email": "", "phone_number": "+15550100", "timezone": None, "type": 1},
+        },
+        {"id": "3", "type": "", "user_info": {"email": "x@example.com", "type": 1}},
+        {"name": "no id", "user_info": {"type": 1}},
+    ]
+
+    def setUp(self):
+        self.helper = ZoomTransformerHelper()
+
+    def users(self):
+        return copy.deepcopy(self.USERS)
+
+    def test_transform_user_data(self):
+        """Contact fields move to user_info and the type defaults to 1; the input keeps its contact."""
+        users = self.users()
+        result = [self.helper.transform_user_data(user) for user in users]
+
+        self.assertEqual(result, self.EXPECTED)
+        self.assertIn("contact", users[0])
+
+    def test_inplace_rewrites_record(self):
+        user = self.users()[0]
+        result = self.helper.transform_user_data(user, inplace=True)
+
+        self.assertIs(result, user)
+        self.assertEqual(result, self.EXPECTED[0])
+
+    def test_batch_matches_single_record_transform(self):
+        users = self.users()
+        result = self.helper.transform_user_data_batch(users)
+
+        self.assertEqual(result, self.EXPECTED)
+        self.assertEqual([user.get("contact") for user in users], [user.get("contact") for user in self.USERS])
+        self.assertEqual(self.helper.transform_user_data_batch([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -114,13 +114,13 @@ def verify_redis_connection(pm):
     """Verify Redis connection is working."""
     try:
         pm.redis_client.ping()
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = os.getenv('REDIS_PORT', '6379')
+        redis_host = pm.redis_client.connection_pool.connection_kwargs['host']
+        redis_port = pm.redis_client.connection_pool.connection_kwargs['port']
         print(f"✅ Redis connection successful (connected to {redis_host}:{redis_port})")
         return True
     except Exception as e:
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = os.getenv('REDIS_PORT', '6379')
+        redis_host = pm.redis_client.connection_pool.connection_kwargs['host']
+        redis_port = pm.redis_client.connection_pool.connection_kwargs['port']
         print(f"❌ Redis connection failed: {e}")
         print(f"   Trying to connect to {redis_host}:{redis_port}")
         print("   Make sure Redis is running and accessible")